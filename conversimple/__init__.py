@@ -5,8 +5,10 @@ This SDK enables customers to build and deploy AI agents that integrate with
 the Conversimple platform's WebRTC infrastructure and conversation management.
 """
 
-from .agent import ConversimpleAgent
-from .dispatcher import AgentRegistry, ConversimpleDispatcher, run_dispatcher
+from typing import TYPE_CHECKING, Any
+import importlib
+
+from ._version import __version__
 from .tools import tool, tool_async
 from .callbacks import (
     ConversationLifecycleEvent,
@@ -14,22 +16,65 @@ from .callbacks import (
     ErrorEvent,
     ConfigUpdateEvent
 )
-from .api import (
-    PlatformClient,
-    Agent,
-    Deployment,
-    ApiKeyInfo,
-    ApiKeyUsage,
-    ListResponse,
-    APIError,
-    ValidationError,
-    NotFoundError,
-    UnauthorizedError,
-    ForbiddenError,
-)
 from .config import Config
 
-__version__ = "0.3.0"
+if TYPE_CHECKING:
+    from .agent import ConversimpleAgent
+    from .dispatcher import AgentRegistry, ConversimpleDispatcher, run_dispatcher
+    from .api import (
+        PlatformClient,
+        AsyncPlatformClient,
+        Agent,
+        Deployment,
+        ApiKeyInfo,
+        ApiKeyUsage,
+        ListResponse,
+        APIError,
+        ValidationError,
+        NotFoundError,
+        UnauthorizedError,
+        ForbiddenError,
+    )
+
+_LAZY_IMPORTS = {
+    "ConversimpleAgent": ".agent",
+    "AgentRegistry": ".dispatcher",
+    "ConversimpleDispatcher": ".dispatcher",
+    "run_dispatcher": ".dispatcher",
+    **dict.fromkeys(
+        [
+            "PlatformClient",
+            "AsyncPlatformClient",
+            "Agent",
+            "Deployment",
+            "ApiKeyInfo",
+            "ApiKeyUsage",
+            "ListResponse",
+            "APIError",
+            "ValidationError",
+            "NotFoundError",
+            "UnauthorizedError",
+            "ForbiddenError",
+        ],
+        ".api",
+    ),
+}
+"""Exports whose modules (websockets, httpx, pydantic) load on first access."""
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
     # Configuration
     "Config",
@@ -48,6 +93,7 @@ __all__ = [
     "run_dispatcher",
     # Platform API client
     "PlatformClient",
+    "AsyncPlatformClient",
     # API models
     "Agent",
     "Deployment",
@@ -0,0 +1,3 @@
+"""Version information for Conversimple SDK."""
+
+__version__ = "0.3.0"
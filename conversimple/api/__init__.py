@@ -1,6 +1,7 @@
 """Conversimple Platform API Client."""
 
-from conversimple.api.client import PlatformClient
+from typing import TYPE_CHECKING, Any
+
 from conversimple.api.exceptions import (
     APIError,
     ForbiddenError,
@@ -16,8 +17,24 @@ from conversimple.api.models import (
     ListResponse,
 )
 
+if TYPE_CHECKING:
+    from conversimple.api.client import AsyncPlatformClient, PlatformClient
+
+
+def __getattr__(name: str) -> Any:
+    # The clients pull in httpx; import them only when first used.
+    if name in ("PlatformClient", "AsyncPlatformClient"):
+        from conversimple.api import client
+
+        value = getattr(client, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "PlatformClient",
+    "AsyncPlatformClient",
     "APIError",
     "ValidationError",
     "NotFoundError",
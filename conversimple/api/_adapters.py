@@ -0,0 +1,19 @@
+"""Shared pydantic TypeAdapters for validating API response data.
+
+Each adapter compiles its schema once per process and is reused by the sync
+and async endpoint classes.
+"""
+
+from pydantic import TypeAdapter
+
+from conversimple.api.models import Agent, ApiKeyInfo, ApiKeyUsage, Deployment
+
+
+AGENT_ADAPTER = TypeAdapter(Agent)
+AGENT_LIST_ADAPTER = TypeAdapter(list[Agent])
+
+DEPLOYMENT_ADAPTER = TypeAdapter(Deployment)
+DEPLOYMENT_LIST_ADAPTER = TypeAdapter(list[Deployment])
+
+API_KEY_INFO_ADAPTER = TypeAdapter(ApiKeyInfo)
+API_KEY_USAGE_ADAPTER = TypeAdapter(ApiKeyUsage)
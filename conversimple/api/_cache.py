@@ -0,0 +1,94 @@
+"""In-process TTL cache for idempotent API reads."""
+
+import threading
+import time
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class TTLCache(Generic[K]):
+    """Thread-safe cache whose entries expire after a per-entry TTL.
+
+    An entry can be kept for an extra ``stale_ttl`` seconds after it expires.
+    :meth:`get` still returns it during that window together with its expiry
+    time, so the caller can decide whether a stale value is acceptable (for
+    example when refreshing it fails).
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries kept at once
+        """
+        self.maxsize = maxsize
+        self._data: dict[K, tuple[float, float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[tuple[float, Any]]:
+        """Look up an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (expiry time on the ``time.monotonic()`` clock, value),
+            or None if the key is missing or past its stale window
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, stale_until, value = entry
+            if time.monotonic() >= stale_until:
+                del self._data[key]
+                return None
+            return expires_at, value
+
+    def set(
+        self,
+        key: K,
+        value: Any,
+        ttl: float,
+        stale_ttl: float = 0.0,
+    ) -> None:
+        """Store an entry.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds until the entry expires
+            stale_ttl: Extra seconds an expired entry is kept for stale reads
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                self._evict(now)
+            self._data[key] = (now + ttl, now + ttl + stale_ttl, value)
+
+    def delete_where(self, predicate: Callable[[K], bool]) -> None:
+        """Remove every entry whose key matches ``predicate``.
+
+        Args:
+            predicate: Called with each key; entries returning True are removed
+        """
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self, now: float) -> None:
+        """Drop dead entries, then the oldest ones, until there is room."""
+        for key in [k for k, entry in self._data.items() if now >= entry[1]]:
+            del self._data[key]
+        while len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
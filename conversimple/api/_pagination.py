@@ -0,0 +1,144 @@
+"""Page-walking helpers behind the endpoint ``iter_*`` methods."""
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterator,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+Page = tuple[list[T], dict[str, Any]]
+
+
+def _has_next_page(page: int, per_page: int, count: int, meta: dict) -> bool:
+    """Whether another page can follow ``page``, given its item count and metadata.
+
+    ``total_count`` is trusted when the server sends it, measured against the
+    page size it actually served (which may be capped below ``per_page``).
+    Without it, a short page is taken to be the last one.
+    """
+    total_count = meta.get("total_count")
+    if total_count is None:
+        return count >= per_page
+    if not count:
+        return False
+    return page * (meta.get("per_page") or count) < total_count
+
+
+def iter_prefetched(
+    fetch_page: Callable[[int], Page[T]],
+    per_page: int,
+) -> Iterator[T]:
+    """Yield items from consecutive pages, fetching page N+1 while N is consumed.
+
+    Args:
+        fetch_page: Returns (items, pagination metadata) for a 1-based page
+        per_page: Page size passed to ``fetch_page``
+
+    Yields:
+        Items in page order
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        page = 1
+        future: Optional[Future[Page[T]]] = executor.submit(fetch_page, page)
+        while future is not None:
+            items, meta = future.result()
+            future = None
+            if _has_next_page(page, per_page, len(items), meta):
+                future = executor.submit(fetch_page, page + 1)
+            yield from items
+            page += 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_prefetched(
+    fetch_page: Callable[[int], Coroutine[Any, Any, Page[T]]],
+    per_page: int,
+) -> AsyncIterator[T]:
+    """Async variant of :func:`iter_prefetched` using a background task.
+
+    Args:
+        fetch_page: Coroutine returning (items, pagination metadata) for a
+            1-based page
+        per_page: Page size passed to ``fetch_page``
+
+    Yields:
+        Items in page order
+    """
+    page = 1
+    task: Optional[asyncio.Task[Page[T]]] = asyncio.create_task(fetch_page(page))
+    try:
+        while task is not None:
+            items, meta = await task
+            task = None
+            if _has_next_page(page, per_page, len(items), meta):
+                task = asyncio.create_task(fetch_page(page + 1))
+            for item in items:
+                yield item
+            page += 1
+    finally:
+        if task is not None:
+            task.cancel()
+
+
+def iter_streamed(
+    stream_page: Callable[[int, dict[str, Any]], Iterator[T]],
+    per_page: int,
+) -> Iterator[T]:
+    """Yield items from consecutive streamed pages until the last one is read.
+
+    Args:
+        stream_page: Returns an iterator over the items of a 1-based page,
+            filling the given dict with the page's pagination metadata once
+            exhausted
+        per_page: Page size passed to ``stream_page``
+
+    Yields:
+        Items in page order
+    """
+    page = 1
+    while True:
+        count = 0
+        meta: dict[str, Any] = {}
+        for item in stream_page(page, meta):
+            count += 1
+            yield item
+        if not _has_next_page(page, per_page, count, meta):
+            return
+        page += 1
+
+
+async def aiter_streamed(
+    stream_page: Callable[[int, dict[str, Any]], AsyncIterator[T]],
+    per_page: int,
+) -> AsyncIterator[T]:
+    """Async variant of :func:`iter_streamed`.
+
+    Args:
+        stream_page: Returns an async iterator over the items of a 1-based
+            page, filling the given dict with the page's pagination metadata
+            once exhausted
+        per_page: Page size passed to ``stream_page``
+
+    Yields:
+        Items in page order
+    """
+    page = 1
+    while True:
+        count = 0
+        meta: dict[str, Any] = {}
+        async for item in stream_page(page, meta):
+            count += 1
+            yield item
+        if not _has_next_page(page, per_page, count, meta):
+            return
+        page += 1
@@ -0,0 +1,115 @@
+"""Incremental extraction of JSON array items from streamed response bodies."""
+
+from typing import Any, Generator, Optional
+
+import orjson
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # optional dependency: pip install conversimple-sdk[stream]
+    ijson = None
+
+
+class JSONItemParser:
+    """Extract the values at an ijson-style prefix from a JSON byte stream.
+
+    A prefix names a path into the document, with ``item`` standing for each
+    element of an array: ``"data.item"`` yields every element of the
+    top-level ``data`` list, ``"data.tools.item"`` every element of
+    ``data["tools"]``.
+
+    Feed body chunks as they arrive and collect the items each call returns.
+    With ijson installed, items are produced as soon as they are complete
+    and the full body is never held in memory; without it the body is
+    buffered and parsed with orjson once :meth:`close` is called.
+    """
+
+    def __init__(self, prefix: str, meta_prefix: Optional[str] = None):
+        """Initialize parser.
+
+        Args:
+            prefix: Path to the items to extract (e.g., "data.item")
+            meta_prefix: Path to a single value to keep in :attr:`meta`
+                (e.g., "meta"), available once :meth:`close` has returned
+        """
+        self.prefix = prefix
+        self.meta_prefix = meta_prefix
+        self.meta: Any = None
+        self._items: list[Any] = []
+        if ijson is None:
+            self._chunks: list[bytes] = []
+        elif meta_prefix is None:
+            self._items = ijson.sendable_list()
+            self._coro = ijson.items_coro(self._items, prefix, use_float=True)
+        else:
+            self._items = ijson.sendable_list()
+            self._meta_values = ijson.sendable_list()
+            fork = _fork(
+                ijson.common.items_basecoro(self._items, prefix),
+                ijson.common.items_basecoro(self._meta_values, meta_prefix),
+            )
+            next(fork)
+            self._coro = ijson.parse_coro(fork, use_float=True)
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Parse a chunk of the body.
+
+        Args:
+            chunk: Next chunk of the response body
+
+        Returns:
+            Items completed by this chunk
+        """
+        if ijson is None:
+            self._chunks.append(chunk)
+            return []
+        self._coro.send(chunk)
+        return self._drain()
+
+    def close(self) -> list[Any]:
+        """Finish parsing.
+
+        Returns:
+            Items not returned by :meth:`feed` yet
+        """
+        if ijson is None:
+            body = b"".join(self._chunks)
+            if not body:
+                return []
+            document = orjson.loads(body)
+            if self.meta_prefix is not None:
+                self.meta = next(
+                    iter(_walk(document, self.meta_prefix.split("."))), None
+                )
+            return _walk(document, self.prefix.split("."))
+        self._coro.close()
+        if self.meta_prefix is not None and self._meta_values:
+            self.meta = self._meta_values[0]
+        return self._drain()
+
+    def _drain(self) -> list[Any]:
+        items = list(self._items)
+        del self._items[:]
+        return items
+
+
+def _fork(*targets: Any) -> Generator[None, Any, None]:
+    """Coroutine sending every ijson event it receives on to all ``targets``."""
+    while True:
+        event = yield
+        for target in targets:
+            target.send(event)
+
+
+def _walk(node: Any, path: list[str]) -> list[Any]:
+    """Collect the values at ``path`` in an already decoded document."""
+    if not path:
+        return [node]
+    head, rest = path[0], path[1:]
+    if head == "item":
+        if not isinstance(node, list):
+            return []
+        return [value for element in node for value in _walk(element, rest)]
+    if not isinstance(node, dict) or head not in node:
+        return []
+    return _walk(node[head], rest)
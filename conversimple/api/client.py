@@ -1,11 +1,18 @@
-"""HTTP client and main PlatformClient for Conversimple API."""
+"""HTTP clients and PlatformClient/AsyncPlatformClient for Conversimple API."""
 
-import json
+import asyncio
 import logging
-from typing import Any, Optional
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Iterator, Optional
 
 import httpx
+import orjson
 
+from conversimple._version import __version__
+from conversimple.api._cache import TTLCache
+from conversimple.api._stream import JSONItemParser
 from conversimple.api.exceptions import (
     APIError,
     ForbiddenError,
@@ -13,16 +20,39 @@ from conversimple.api.exceptions import (
     UnauthorizedError,
     ValidationError,
 )
-from conversimple.api.endpoints.agents import AgentEndpoint
-from conversimple.api.endpoints.api_keys import ApiKeyEndpoint
-from conversimple.api.endpoints.deployments import DeploymentEndpoint
+from conversimple.api.endpoints.agents import AgentEndpoint, AsyncAgentEndpoint
+from conversimple.api.endpoints.api_keys import ApiKeyEndpoint, AsyncApiKeyEndpoint
+from conversimple.api.endpoints.deployments import (
+    AsyncDeploymentEndpoint,
+    DeploymentEndpoint,
+)
 from conversimple.config import Config
 
 logger = logging.getLogger(__name__)
 
+_STATUS_EXC: dict[int, type[APIError]] = {
+    401: UnauthorizedError,
+    403: ForbiddenError,
+    404: NotFoundError,
+    422: ValidationError,
+}
+"""Exception raised for each HTTP status code; anything else is APIError."""
+
+CacheKey = tuple[str, str, frozenset[tuple[str, Any]]]
+"""Response cache key: (method, path, query params)."""
+
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+"""Status codes treated as transient and retried with backoff."""
+
+_HEADERS_TEMPLATE = {
+    "Content-Type": "application/json",
+    "User-Agent": f"conversimple-sdk/{__version__}",
+}
+"""Headers sent on every request; each client adds its own Authorization."""
 
-class HTTPClient:
-    """Base HTTP client for API requests."""
+
+class _BaseHTTPClient(ABC):
+    """Configuration and error handling shared by the sync and async clients."""
 
     def __init__(
         self,
@@ -30,6 +60,12 @@ class HTTPClient:
         api_endpoint: Optional[str] = None,
         timeout: Optional[int] = None,
         verbose: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        http2: Optional[bool] = None,
+        cache_enabled: Optional[bool] = None,
+        cache_ttl: Optional[float] = None,
+        max_retries: Optional[int] = None,
     ):
         """Initialize HTTP client.
 
@@ -38,26 +74,171 @@ class HTTPClient:
             api_endpoint: API endpoint URL (defaults from Config)
             timeout: Request timeout in seconds (defaults from Config)
             verbose: Enable verbose logging (defaults from Config)
+            max_connections: Connection pool size (defaults from Config)
+            max_keepalive_connections: Idle connections kept open for reuse
+                (defaults from Config)
+            http2: Enable HTTP/2, requires ``httpx[http2]`` (defaults from Config)
+            cache_enabled: Cache idempotent GET responses (defaults from Config)
+            cache_ttl: Default cache lifetime in seconds for single-resource
+                reads (defaults from Config)
+            max_retries: Retries for transient failures (defaults from Config)
+
+        Raises:
+            ValueError: If ``max_retries`` is negative
         """
         self.api_key = api_key
         self.api_endpoint = (api_endpoint or Config.API_ENDPOINT).rstrip("/")
         self.timeout = timeout if timeout is not None else Config.API_TIMEOUT
         self.verbose = verbose if verbose is not None else Config.VERBOSE
+        self.limits = httpx.Limits(
+            max_connections=(
+                max_connections
+                if max_connections is not None
+                else Config.HTTPX_MAX_CONNECTIONS
+            ),
+            max_keepalive_connections=(
+                max_keepalive_connections
+                if max_keepalive_connections is not None
+                else Config.HTTPX_MAX_KEEPALIVE
+            ),
+        )
+        self.http2 = http2 if http2 is not None else Config.HTTPX_HTTP2
+        self.cache_ttl = (
+            cache_ttl if cache_ttl is not None else Config.CACHE_DEFAULT_TTL
+        )
+        if cache_enabled is None:
+            cache_enabled = Config.CACHE_ENABLED
+        self._cache: Optional[TTLCache[CacheKey]] = (
+            TTLCache() if cache_enabled else None
+        )
+        self.max_retries = (
+            max_retries if max_retries is not None else Config.MAX_HTTP_RETRIES
+        )
+        if self.max_retries < 0:
+            raise ValueError(f"max_retries must be >= 0, got {self.max_retries}")
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            **_HEADERS_TEMPLATE,
+        }
 
         if self.verbose:
             logger.setLevel(logging.DEBUG)
+            logger.debug(
+                f"HTTP pool: max_connections={self.limits.max_connections} "
+                f"max_keepalive_connections={self.limits.max_keepalive_connections} "
+                f"http2={self.http2}"
+            )
+
+        # One pooled client for the lifetime of this object so consecutive
+        # calls reuse keep-alive connections instead of re-handshaking.
+        self._client = self._create_client()
+
+    @abstractmethod
+    def _create_client(self) -> Any:
+        """Create the underlying httpx client."""
+
+    def invalidate(self, path: str) -> None:
+        """Drop cached GET responses for a path, whatever their query params.
+
+        Args:
+            path: API path (e.g., "/api/v1/agents/123")
+        """
+        if self._cache is not None:
+            self._cache.delete_where(lambda key: key[1] == path)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Drop cached GET responses for every path starting with a prefix.
+
+        Args:
+            prefix: API path prefix (e.g., "/api/v1/agents/123/")
+        """
+        if self._cache is not None:
+            self._cache.delete_where(lambda key: key[1].startswith(prefix))
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached GET responses."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _cache_lookup(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]],
+        cache_ttl: Optional[float],
+    ) -> tuple[Optional[CacheKey], Optional[tuple[float, Any]]]:
+        """Find a cached GET response.
+
+        Returns:
+            Tuple of (cache key, cached entry). The key is None when the
+            request is not cacheable; the entry is None on a miss and may be
+            past its expiry (usable only as a stale fallback).
+        """
+        if not cache_ttl or self._cache is None:
+            return None, None
+        key: CacheKey = ("GET", path, frozenset((params or {}).items()))
+        return key, self._cache.get(key)
+
+    def _cache_store(
+        self,
+        key: CacheKey,
+        content: bytes,
+        cache_ttl: Optional[float],
+    ) -> None:
+        """Cache a raw GET response body, kept one extra TTL as a stale fallback.
+
+        Bodies are stored undecoded so every hit hands out a fresh object
+        that callers are free to mutate. Only called with a key returned by
+        :meth:`_cache_lookup`, which implies caching is on and a TTL is set.
+        """
+        assert self._cache is not None and cache_ttl
+        self._cache.set(key, content, cache_ttl, stale_ttl=cache_ttl)
+
+    @staticmethod
+    def _decode(content: bytes) -> Any:
+        """Decode a JSON response body; an empty body decodes to ``{}``."""
+        return orjson.loads(content) if content else {}
+
+    @staticmethod
+    def _encode(body: Optional[dict[str, Any]]) -> Optional[bytes]:
+        """Encode a JSON request body."""
+        return None if body is None else orjson.dumps(body)
+
+    def _should_retry(self, response: httpx.Response, idempotent: bool) -> bool:
+        """Whether a response is a transient failure worth retrying.
+
+        429 is always retried since the server rejected the request without
+        acting on it; gateway errors only for idempotent requests.
+        """
+        if response.status_code == 429:
+            return True
+        return idempotent and response.status_code in _RETRY_STATUSES
+
+    def _retry_delay(
+        self,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+    ) -> float:
+        """Seconds to wait before retry number ``attempt + 1``.
+
+        Uses the server's ``Retry-After`` header when present, otherwise
+        exponential backoff with jitter. Both are capped at Config.MAX_BACKOFF.
+        """
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(Config.MAX_BACKOFF, float(retry_after))
+        delay = Config.HTTP_RETRY_BASE_DELAY * Config.RECONNECT_BACKOFF ** attempt
+        return min(Config.MAX_BACKOFF, delay) + random.uniform(0, 0.25)
 
     def _get_headers(self) -> dict[str, str]:
         """Get request headers with authentication.
 
+        Headers are built once in ``__init__`` and sent as client defaults.
+
         Returns:
             Headers dictionary
         """
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "conversimple-sdk/0.3.0",
-        }
+        return self._headers
 
     def _handle_error(self, response: httpx.Response) -> None:
         """Handle API error responses.
@@ -68,54 +249,116 @@ class HTTPClient:
         Raises:
             Specific APIError subclass based on status code
         """
-        try:
-            data = response.json()
-        except json.JSONDecodeError:
+        data = None
+        media_type = response.headers.get("content-type", "").split(";")[0]
+        media_type = media_type.strip().lower()
+        if media_type in ("", "application/json") or media_type.endswith("+json"):
+            try:
+                data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                pass
+        if not isinstance(data, dict):
             data = {"message": response.text}
 
         error_message = data.get("message", response.reason_phrase)
+        exc_cls = _STATUS_EXC.get(response.status_code, APIError)
+        raise exc_cls(
+            message=error_message,
+            status_code=response.status_code,
+            response_data=data,
+        )
 
-        if response.status_code == 422:
-            raise ValidationError(
-                message=error_message,
-                status_code=response.status_code,
-                response_data=data,
-            )
-        elif response.status_code == 404:
-            raise NotFoundError(
-                message=error_message,
-                status_code=response.status_code,
-                response_data=data,
-            )
-        elif response.status_code == 401:
-            raise UnauthorizedError(
-                message=error_message,
-                status_code=response.status_code,
-                response_data=data,
-            )
-        elif response.status_code == 403:
-            raise ForbiddenError(
-                message=error_message,
-                status_code=response.status_code,
-                response_data=data,
-            )
-        else:
-            raise APIError(
-                message=error_message,
-                status_code=response.status_code,
-                response_data=data,
+
+class HTTPClient(_BaseHTTPClient):
+    """Synchronous HTTP client for API requests."""
+
+    def _create_client(self) -> httpx.Client:
+        return httpx.Client(
+            base_url=self.api_endpoint,
+            headers=self._headers,
+            timeout=self.timeout,
+            limits=self.limits,
+            http2=self.http2,
+        )
+
+    def close(self) -> None:
+        """Close the underlying connection pool."""
+        self._client.close()
+
+    def __enter__(self) -> "HTTPClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        idempotent: bool,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures.
+
+        Args:
+            method: HTTP method
+            path: API path
+            idempotent: Whether the request may be repeated safely; only
+                idempotent requests are retried on 5xx and network errors
+            **kwargs: Passed through to ``httpx.Client.request``
+
+        Returns:
+            Successful HTTP response
+
+        Raises:
+            APIError or subclass for error responses
+            httpx.TransportError if the request could not be sent
+        """
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            try:
+                response = self._client.request(method, path, **kwargs)
+            except httpx.TransportError as e:
+                if not idempotent or last_attempt:
+                    raise
+                delay = self._retry_delay(attempt)
+                reason = type(e).__name__
+            else:
+                if last_attempt or not self._should_retry(response, idempotent):
+                    if response.is_error:
+                        self._handle_error(response)
+                    return response
+                delay = self._retry_delay(attempt, response)
+                reason = str(response.status_code)
+
+            logger.warning(
+                f"{method} {path} failed ({reason}), retrying in {delay:.2f}s "
+                f"({attempt + 1}/{self.max_retries})"
             )
+            time.sleep(delay)
+        raise AssertionError("unreachable: the last attempt returns or raises")
 
-    def get(
+    def _request(
         self,
+        method: str,
         path: str,
+        *,
         params: Optional[dict[str, Any]] = None,
+        json: Optional[dict[str, Any]] = None,
+        idempotent: bool = False,
+        cache_ttl: Optional[float] = None,
     ) -> dict[str, Any]:
-        """Make GET request.
+        """Make request and decode the JSON response.
 
         Args:
+            method: HTTP method
             path: API path (e.g., "/api/v1/agents")
             params: Query parameters
+            json: Request body as JSON
+            idempotent: Allow retrying on 5xx and network errors
+            cache_ttl: Seconds to cache the response for; ignored unless
+                caching is enabled on this client
 
         Returns:
             Response JSON
@@ -123,61 +366,201 @@ class HTTPClient:
         Raises:
             APIError or subclass for error responses
         """
-        url = f"{self.api_endpoint}{path}"
-        headers = self._get_headers()
+        cache_key, cached = self._cache_lookup(path, params, cache_ttl)
+        fresh = cached is not None and cached[0] > time.monotonic()
 
         if self.verbose:
-            logger.debug(f"GET {url} params={params}")
+            logger.debug(
+                f"{method} {self.api_endpoint}{path} params={params} body={json}"
+                + (" (cached)" if fresh else "")
+            )
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(url, params=params, headers=headers)
+        if fresh and cached is not None:
+            return self._decode(cached[1])
 
-        if response.status_code >= 400:
-            self._handle_error(response)
+        try:
+            response = self._send(
+                method,
+                path,
+                idempotent=idempotent,
+                params=params,
+                content=self._encode(json),
+            )
+        except httpx.TransportError:
+            if cached is None:
+                raise
+            logger.warning(f"{method} {path} failed, using stale cached response")
+            return self._decode(cached[1])
 
-        return response.json()
+        if cache_key is not None:
+            self._cache_store(cache_key, response.content, cache_ttl)
+        return self._decode(response.content)
 
-    def post(
+    def get(
         self,
         path: str,
-        json: Optional[dict[str, Any]] = None,
+        params: Optional[dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
     ) -> dict[str, Any]:
-        """Make POST request.
+        """Make GET request; see :meth:`_request`."""
+        return self._request(
+            "GET", path, params=params, idempotent=True, cache_ttl=cache_ttl
+        )
+
+    def stream_get(
+        self,
+        path: str,
+        prefix: str,
+        params: Optional[dict[str, Any]] = None,
+        meta: Optional[dict[str, Any]] = None,
+    ) -> Iterator[Any]:
+        """Make GET request and yield items from the body as they arrive.
+
+        Keeps memory proportional to one item rather than the whole response
+        when ``ijson`` is installed. Streamed reads bypass the response cache
+        and are not retried.
 
         Args:
             path: API path
-            json: Request body as JSON
+            prefix: Location of the items in the body, in ijson prefix
+                syntax (e.g., "data.item")
+            params: Query parameters
+            meta: Updated with the body's top-level ``meta`` object (e.g.,
+                pagination metadata) once all items have been yielded
 
-        Returns:
-            Response JSON
+        Yields:
+            Decoded items found at ``prefix``
 
         Raises:
             APIError or subclass for error responses
         """
-        url = f"{self.api_endpoint}{path}"
-        headers = self._get_headers()
-
         if self.verbose:
-            logger.debug(f"POST {url} body={json}")
+            logger.debug(f"GET {self.api_endpoint}{path} params={params} (stream)")
+
+        with self._client.stream("GET", path, params=params) as response:
+            if response.is_error:
+                response.read()
+                self._handle_error(response)
+            parser = JSONItemParser(prefix, "meta" if meta is not None else None)
+            for chunk in response.iter_bytes():
+                yield from parser.feed(chunk)
+            yield from parser.close()
+            if meta is not None and isinstance(parser.meta, dict):
+                meta.update(parser.meta)
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(url, json=json, headers=headers)
-
-        if response.status_code >= 400:
-            self._handle_error(response)
-
-        return response.json()
+    def post(
+        self,
+        path: str,
+        json: Optional[dict[str, Any]] = None,
+        idempotent: bool = False,
+    ) -> dict[str, Any]:
+        """Make POST request; see :meth:`_request`."""
+        return self._request("POST", path, json=json, idempotent=idempotent)
 
     def put(
         self,
         path: str,
         json: Optional[dict[str, Any]] = None,
+        idempotent: bool = False,
     ) -> dict[str, Any]:
-        """Make PUT request.
+        """Make PUT request; see :meth:`_request`."""
+        return self._request("PUT", path, json=json, idempotent=idempotent)
+
+    def delete(self, path: str, idempotent: bool = False) -> dict[str, Any]:
+        """Make DELETE request; see :meth:`_request`."""
+        return self._request("DELETE", path, idempotent=idempotent)
+
+
+class AsyncHTTPClient(_BaseHTTPClient):
+    """Asynchronous HTTP client for API requests."""
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.api_endpoint,
+            headers=self._headers,
+            timeout=self.timeout,
+            limits=self.limits,
+            http2=self.http2,
+        )
+
+    async def close(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncHTTPClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        idempotent: bool,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures.
 
         Args:
+            method: HTTP method
             path: API path
+            idempotent: Whether the request may be repeated safely; only
+                idempotent requests are retried on 5xx and network errors
+            **kwargs: Passed through to ``httpx.AsyncClient.request``
+
+        Returns:
+            Successful HTTP response
+
+        Raises:
+            APIError or subclass for error responses
+            httpx.TransportError if the request could not be sent
+        """
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            try:
+                response = await self._client.request(method, path, **kwargs)
+            except httpx.TransportError as e:
+                if not idempotent or last_attempt:
+                    raise
+                delay = self._retry_delay(attempt)
+                reason = type(e).__name__
+            else:
+                if last_attempt or not self._should_retry(response, idempotent):
+                    if response.is_error:
+                        self._handle_error(response)
+                    return response
+                delay = self._retry_delay(attempt, response)
+                reason = str(response.status_code)
+
+            logger.warning(
+                f"{method} {path} failed ({reason}), retrying in {delay:.2f}s "
+                f"({attempt + 1}/{self.max_retries})"
+            )
+            await asyncio.sleep(delay)
+        raise AssertionError("unreachable: the last attempt returns or raises")
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[dict[str, Any]] = None,
+        json: Optional[dict[str, Any]] = None,
+        idempotent: bool = False,
+        cache_ttl: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Make async request and decode the JSON response.
+
+        Args:
+            method: HTTP method
+            path: API path (e.g., "/api/v1/agents")
+            params: Query parameters
             json: Request body as JSON
+            idempotent: Allow retrying on 5xx and network errors
+            cache_ttl: Seconds to cache the response for; ignored unless
+                caching is enabled on this client
 
         Returns:
             Response JSON
@@ -185,45 +568,111 @@ class HTTPClient:
         Raises:
             APIError or subclass for error responses
         """
-        url = f"{self.api_endpoint}{path}"
-        headers = self._get_headers()
+        cache_key, cached = self._cache_lookup(path, params, cache_ttl)
+        fresh = cached is not None and cached[0] > time.monotonic()
 
         if self.verbose:
-            logger.debug(f"PUT {url} body={json}")
+            logger.debug(
+                f"{method} {self.api_endpoint}{path} params={params} body={json}"
+                + (" (cached)" if fresh else "")
+            )
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.put(url, json=json, headers=headers)
+        if fresh and cached is not None:
+            return self._decode(cached[1])
 
-        if response.status_code >= 400:
-            self._handle_error(response)
+        try:
+            response = await self._send(
+                method,
+                path,
+                idempotent=idempotent,
+                params=params,
+                content=self._encode(json),
+            )
+        except httpx.TransportError:
+            if cached is None:
+                raise
+            logger.warning(f"{method} {path} failed, using stale cached response")
+            return self._decode(cached[1])
 
-        return response.json()
+        if cache_key is not None:
+            self._cache_store(cache_key, response.content, cache_ttl)
+        return self._decode(response.content)
 
-    def delete(self, path: str) -> dict[str, Any]:
-        """Make DELETE request.
+    async def get(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Make async GET request; see :meth:`_request`."""
+        return await self._request(
+            "GET", path, params=params, idempotent=True, cache_ttl=cache_ttl
+        )
+
+    async def stream_get(
+        self,
+        path: str,
+        prefix: str,
+        params: Optional[dict[str, Any]] = None,
+        meta: Optional[dict[str, Any]] = None,
+    ) -> AsyncIterator[Any]:
+        """Make async GET request and yield items from the body as they arrive.
+
+        Keeps memory proportional to one item rather than the whole response
+        when ``ijson`` is installed. Streamed reads bypass the response cache
+        and are not retried.
 
         Args:
             path: API path
+            prefix: Location of the items in the body, in ijson prefix
+                syntax (e.g., "data.item")
+            params: Query parameters
+            meta: Updated with the body's top-level ``meta`` object (e.g.,
+                pagination metadata) once all items have been yielded
 
-        Returns:
-            Response JSON
+        Yields:
+            Decoded items found at ``prefix``
 
         Raises:
             APIError or subclass for error responses
         """
-        url = f"{self.api_endpoint}{path}"
-        headers = self._get_headers()
-
         if self.verbose:
-            logger.debug(f"DELETE {url}")
-
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.delete(url, headers=headers)
+            logger.debug(f"GET {self.api_endpoint}{path} params={params} (stream)")
+
+        async with self._client.stream("GET", path, params=params) as response:
+            if response.is_error:
+                await response.aread()
+                self._handle_error(response)
+            parser = JSONItemParser(prefix, "meta" if meta is not None else None)
+            async for chunk in response.aiter_bytes():
+                for item in parser.feed(chunk):
+                    yield item
+            for item in parser.close():
+                yield item
+            if meta is not None and isinstance(parser.meta, dict):
+                meta.update(parser.meta)
+
+    async def post(
+        self,
+        path: str,
+        json: Optional[dict[str, Any]] = None,
+        idempotent: bool = False,
+    ) -> dict[str, Any]:
+        """Make async POST request; see :meth:`_request`."""
+        return await self._request("POST", path, json=json, idempotent=idempotent)
 
-        if response.status_code >= 400:
-            self._handle_error(response)
+    async def put(
+        self,
+        path: str,
+        json: Optional[dict[str, Any]] = None,
+        idempotent: bool = False,
+    ) -> dict[str, Any]:
+        """Make async PUT request; see :meth:`_request`."""
+        return await self._request("PUT", path, json=json, idempotent=idempotent)
 
-        return response.json()
+    async def delete(self, path: str, idempotent: bool = False) -> dict[str, Any]:
+        """Make async DELETE request; see :meth:`_request`."""
+        return await self._request("DELETE", path, idempotent=idempotent)
 
 
 class PlatformClient:
@@ -254,7 +703,15 @@ class PlatformClient:
 
         # API key management
         key_info = client.api_keys.get_api_key_info()
+
+        client.close()
         ```
+
+    The client holds a pooled HTTP connection, so create it once and reuse
+    it. It can also be used as a context manager::
+
+        with PlatformClient(api_key="your-api-key") as client:
+            agents, meta = client.agents.list_agents()
     """
 
     def __init__(
@@ -263,6 +720,12 @@ class PlatformClient:
         api_endpoint: Optional[str] = None,
         timeout: Optional[int] = None,
         verbose: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        http2: Optional[bool] = None,
+        cache_enabled: Optional[bool] = None,
+        cache_ttl: Optional[float] = None,
+        max_retries: Optional[int] = None,
     ):
         """Initialize PlatformClient.
 
@@ -271,14 +734,137 @@ class PlatformClient:
             api_endpoint: API endpoint URL (defaults from Config)
             timeout: Request timeout in seconds (defaults from Config)
             verbose: Enable verbose logging (defaults from Config)
+            max_connections: Connection pool size (defaults from Config)
+            max_keepalive_connections: Idle connections kept open for reuse
+                (defaults from Config)
+            http2: Enable HTTP/2, requires ``httpx[http2]`` (defaults from Config)
+            cache_enabled: Cache idempotent GET responses (defaults from Config)
+            cache_ttl: Default cache lifetime in seconds for single-resource
+                reads (defaults from Config)
+            max_retries: Retries for transient failures (defaults from Config)
         """
         self._http_client = HTTPClient(
             api_key=api_key,
             api_endpoint=api_endpoint,
             timeout=timeout,
             verbose=verbose,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            http2=http2,
+            cache_enabled=cache_enabled,
+            cache_ttl=cache_ttl,
+            max_retries=max_retries,
         )
 
         self.agents = AgentEndpoint(self._http_client)
         self.deployments = DeploymentEndpoint(self._http_client)
         self.api_keys = ApiKeyEndpoint(self._http_client)
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached GET responses.
+
+        Use after changing resources outside this client (for example in
+        the dashboard) to force fresh reads.
+        """
+        self._http_client.invalidate_cache()
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http_client.close()
+
+    def __enter__(self) -> "PlatformClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class AsyncPlatformClient:
+    """Asynchronous Conversimple Platform API Client.
+
+    Same endpoints as :class:`PlatformClient`, but every method is a
+    coroutine, so independent calls can run concurrently over one pooled
+    connection.
+
+    Example:
+        ```python
+        import asyncio
+        from conversimple import AsyncPlatformClient
+
+        async def main():
+            async with AsyncPlatformClient(api_key="your-api-key") as client:
+                agents, meta = await client.agents.list_agents()
+                specs = await asyncio.gather(
+                    *(client.agents.get_agent_spec(a.id) for a in agents)
+                )
+
+        asyncio.run(main())
+        ```
+
+    Create one client and share it across tasks; do not create a client
+    per request.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_endpoint: Optional[str] = None,
+        timeout: Optional[int] = None,
+        verbose: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        http2: Optional[bool] = None,
+        cache_enabled: Optional[bool] = None,
+        cache_ttl: Optional[float] = None,
+        max_retries: Optional[int] = None,
+    ):
+        """Initialize AsyncPlatformClient.
+
+        Args:
+            api_key: API key for authentication
+            api_endpoint: API endpoint URL (defaults from Config)
+            timeout: Request timeout in seconds (defaults from Config)
+            verbose: Enable verbose logging (defaults from Config)
+            max_connections: Connection pool size (defaults from Config)
+            max_keepalive_connections: Idle connections kept open for reuse
+                (defaults from Config)
+            http2: Enable HTTP/2, requires ``httpx[http2]`` (defaults from Config)
+            cache_enabled: Cache idempotent GET responses (defaults from Config)
+            cache_ttl: Default cache lifetime in seconds for single-resource
+                reads (defaults from Config)
+            max_retries: Retries for transient failures (defaults from Config)
+        """
+        self._http_client = AsyncHTTPClient(
+            api_key=api_key,
+            api_endpoint=api_endpoint,
+            timeout=timeout,
+            verbose=verbose,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            http2=http2,
+            cache_enabled=cache_enabled,
+            cache_ttl=cache_ttl,
+            max_retries=max_retries,
+        )
+
+        self.agents = AsyncAgentEndpoint(self._http_client)
+        self.deployments = AsyncDeploymentEndpoint(self._http_client)
+        self.api_keys = AsyncApiKeyEndpoint(self._http_client)
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached GET responses.
+
+        Use after changing resources outside this client (for example in
+        the dashboard) to force fresh reads.
+        """
+        self._http_client.invalidate_cache()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._http_client.close()
+
+    async def __aenter__(self) -> "AsyncPlatformClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
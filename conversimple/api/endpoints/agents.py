@@ -1,9 +1,58 @@
 """Agent management endpoints."""
 
-from typing import Any, Optional
-
+from typing import Any, AsyncIterator, Iterator, Optional, TYPE_CHECKING
+
+from conversimple.api._adapters import AGENT_ADAPTER, AGENT_LIST_ADAPTER
+from conversimple.api._pagination import (
+    aiter_prefetched,
+    aiter_streamed,
+    iter_prefetched,
+    iter_streamed,
+)
 from conversimple.api.models import Agent
 
+if TYPE_CHECKING:
+    from conversimple.api.client import AsyncHTTPClient, HTTPClient
+
+
+_PATH_LIST = "/api/v1/agents"
+_PATH_ITEM = "/api/v1/agents/{id}"
+_PATH_ITEM_PREFIX = "/api/v1/agents/{id}/"
+_PATH_SPEC = "/api/v1/agents/{id}/spec"
+_PATH_GENERATION_STATUS = "/api/v1/agents/{id}/generation-status"
+_PATH_PUBLISH = "/api/v1/agents/{id}/publish"
+
+_LIST_CACHE_TTL = 5.0
+"""Seconds list responses stay cached; kept short since lists change often."""
+
+
+def _list_params(
+    per_page: int,
+    status: Optional[str],
+    search: Optional[str],
+) -> dict[str, Any]:
+    """Build list query parameters, leaving out unset filters."""
+    params: dict[str, Any] = {"per_page": per_page}
+    if status:
+        params["status"] = status
+    if search:
+        params["search"] = search
+    return params
+
+
+def _invalidate_agent(client: Any, agent_id: Optional[str] = None) -> None:
+    """Drop cached reads made stale by a change to an agent.
+
+    Every agent mutation invalidates the agent lists; when ``agent_id`` is
+    given, that agent and its sub-resources (spec, generation status) too.
+    Mutations call this even when they fail, since a timed-out or rejected
+    request may still have changed (or revealed a change to) server state.
+    """
+    client.invalidate(_PATH_LIST)
+    if agent_id is not None:
+        client.invalidate(_PATH_ITEM.format(id=agent_id))
+        client.invalidate_prefix(_PATH_ITEM_PREFIX.format(id=agent_id))
+
 
 class AgentEndpoint:
     """Agent management endpoints."""
@@ -34,20 +83,55 @@ class AgentEndpoint:
         Returns:
             Tuple of (agents list, pagination metadata)
         """
-        params = {
-            "page": page,
-            "per_page": per_page,
-        }
-        if status:
-            params["status"] = status
-        if search:
-            params["search"] = search
-
-        response = self.client.get("/api/v1/agents", params=params)
-        agents = [Agent(**agent_data) for agent_data in response["data"]]
+        params = {"page": page, **_list_params(per_page, status, search)}
+        response = self.client.get(
+            _PATH_LIST,
+            params=params,
+            cache_ttl=_LIST_CACHE_TTL,
+        )
+        agents = AGENT_LIST_ADAPTER.validate_python(response["data"])
         meta = response.get("meta", {})
         return agents, meta
 
+    def iter_agents(
+        self,
+        per_page: int = 100,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        prefetch: bool = True,
+    ) -> Iterator[Agent]:
+        """Iterate over all agents, fetching pages as needed.
+
+        By default the next page is requested in the background while the
+        current one is being consumed. With ``prefetch=False`` pages are
+        instead streamed one at a time and agents yielded as they are
+        parsed, keeping memory proportional to a single agent.
+
+        Args:
+            per_page: Items fetched per request (default: 100)
+            status: Filter by status (draft, published, archived)
+            search: Search by name
+            prefetch: Overlap fetching the next page with consuming this one
+
+        Yields:
+            Agents in listing order
+        """
+        if prefetch:
+            yield from iter_prefetched(
+                lambda page: self.list_agents(page, per_page, status, search),
+                per_page,
+            )
+            return
+
+        params = _list_params(per_page, status, search)
+        for agent_data in iter_streamed(
+            lambda page, meta: self.client.stream_get(
+                _PATH_LIST, "data.item", params={**params, "page": page}, meta=meta
+            ),
+            per_page,
+        ):
+            yield AGENT_ADAPTER.validate_python(agent_data)
+
     def create_agent(
         self,
         name: str,
@@ -64,15 +148,18 @@ class AgentEndpoint:
         Returns:
             Created agent
         """
-        payload = {
+        payload: dict[str, Any] = {
             "name": name,
             "description": description,
         }
         if agent_config:
             payload["agent_config"] = agent_config
 
-        response = self.client.post("/api/v1/agents", json=payload)
-        return Agent(**response["data"])
+        try:
+            response = self.client.post(_PATH_LIST, json=payload)
+        finally:
+            _invalidate_agent(self.client)
+        return AGENT_ADAPTER.validate_python(response["data"])
 
     def get_agent(self, agent_id: str) -> Agent:
         """Get agent by ID.
@@ -83,8 +170,11 @@ class AgentEndpoint:
         Returns:
             Agent details
         """
-        response = self.client.get(f"/api/v1/agents/{agent_id}")
-        return Agent(**response["data"])
+        response = self.client.get(
+            _PATH_ITEM.format(id=agent_id),
+            cache_ttl=self.client.cache_ttl,
+        )
+        return AGENT_ADAPTER.validate_python(response["data"])
 
     def update_agent(
         self,
@@ -115,8 +205,11 @@ class AgentEndpoint:
         if not payload:
             raise ValueError("At least one field must be provided for update")
 
-        response = self.client.put(f"/api/v1/agents/{agent_id}", json=payload)
-        return Agent(**response["data"])
+        try:
+            response = self.client.put(_PATH_ITEM.format(id=agent_id), json=payload)
+        finally:
+            _invalidate_agent(self.client, agent_id)
+        return AGENT_ADAPTER.validate_python(response["data"])
 
     def delete_agent(self, agent_id: str) -> None:
         """Delete agent.
@@ -124,7 +217,10 @@ class AgentEndpoint:
         Args:
             agent_id: Agent UUID
         """
-        self.client.delete(f"/api/v1/agents/{agent_id}")
+        try:
+            self.client.delete(_PATH_ITEM.format(id=agent_id))
+        finally:
+            _invalidate_agent(self.client, agent_id)
 
     def get_agent_spec(self, agent_id: str) -> dict[str, Any]:
         """Get agent specification.
@@ -135,9 +231,30 @@ class AgentEndpoint:
         Returns:
             Agent specification (tool definitions, etc.)
         """
-        response = self.client.get(f"/api/v1/agents/{agent_id}/spec")
+        response = self.client.get(
+            _PATH_SPEC.format(id=agent_id),
+            cache_ttl=self.client.cache_ttl,
+        )
         return response.get("data", {})
 
+    def iter_agent_spec_tools(self, agent_id: str) -> Iterator[dict[str, Any]]:
+        """Stream the tool definitions of an agent specification.
+
+        Use instead of :meth:`get_agent_spec` for large generated specs:
+        tools are yielded as they are parsed rather than after the whole
+        specification has been downloaded and decoded.
+
+        Args:
+            agent_id: Agent UUID
+
+        Yields:
+            Tool definitions
+        """
+        yield from self.client.stream_get(
+            _PATH_SPEC.format(id=agent_id),
+            "data.tools.item",
+        )
+
     def get_agent_generation_status(self, agent_id: str) -> dict[str, Any]:
         """Get agent generation status.
 
@@ -147,7 +264,7 @@ class AgentEndpoint:
         Returns:
             Generation status (job_id, status, etc.)
         """
-        response = self.client.get(f"/api/v1/agents/{agent_id}/generation-status")
+        response = self.client.get(_PATH_GENERATION_STATUS.format(id=agent_id))
         return response.get("data", {})
 
     def publish_agent(self, agent_id: str) -> Agent:
@@ -159,5 +276,246 @@ class AgentEndpoint:
         Returns:
             Published agent
         """
-        response = self.client.post(f"/api/v1/agents/{agent_id}/publish", json={})
-        return Agent(**response["data"])
+        try:
+            response = self.client.post(_PATH_PUBLISH.format(id=agent_id), json={})
+        finally:
+            _invalidate_agent(self.client, agent_id)
+        return AGENT_ADAPTER.validate_python(response["data"])
+
+
+class AsyncAgentEndpoint:
+    """Async agent management endpoints."""
+
+    def __init__(self, client: "AsyncHTTPClient"):
+        """Initialize async agent endpoint.
+
+        Args:
+            client: Async HTTP client instance
+        """
+        self.client = client
+
+    async def list_agents(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> tuple[list[Agent], dict[str, Any]]:
+        """List agents with pagination and filtering.
+
+        Args:
+            page: Page number (default: 1)
+            per_page: Items per page (default: 20)
+            status: Filter by status (draft, published, archived)
+            search: Search by name
+
+        Returns:
+            Tuple of (agents list, pagination metadata)
+        """
+        params = {"page": page, **_list_params(per_page, status, search)}
+        response = await self.client.get(
+            _PATH_LIST,
+            params=params,
+            cache_ttl=_LIST_CACHE_TTL,
+        )
+        agents = AGENT_LIST_ADAPTER.validate_python(response["data"])
+        meta = response.get("meta", {})
+        return agents, meta
+
+    async def iter_agents(
+        self,
+        per_page: int = 100,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Agent]:
+        """Iterate over all agents, fetching pages as needed.
+
+        By default the next page is requested in the background while the
+        current one is being consumed. With ``prefetch=False`` pages are
+        instead streamed one at a time and agents yielded as they are
+        parsed, keeping memory proportional to a single agent.
+
+        Args:
+            per_page: Items fetched per request (default: 100)
+            status: Filter by status (draft, published, archived)
+            search: Search by name
+            prefetch: Overlap fetching the next page with consuming this one
+
+        Yields:
+            Agents in listing order
+        """
+        if prefetch:
+            async for agent in aiter_prefetched(
+                lambda page: self.list_agents(page, per_page, status, search),
+                per_page,
+            ):
+                yield agent
+            return
+
+        params = _list_params(per_page, status, search)
+        async for agent_data in aiter_streamed(
+            lambda page, meta: self.client.stream_get(
+                _PATH_LIST, "data.item", params={**params, "page": page}, meta=meta
+            ),
+            per_page,
+        ):
+            yield AGENT_ADAPTER.validate_python(agent_data)
+
+    async def create_agent(
+        self,
+        name: str,
+        description: str,
+        agent_config: Optional[dict[str, Any]] = None,
+    ) -> Agent:
+        """Create a new agent.
+
+        Args:
+            name: Agent name
+            description: Agent description
+            agent_config: Optional agent configuration
+
+        Returns:
+            Created agent
+        """
+        payload: dict[str, Any] = {
+            "name": name,
+            "description": description,
+        }
+        if agent_config:
+            payload["agent_config"] = agent_config
+
+        try:
+            response = await self.client.post(_PATH_LIST, json=payload)
+        finally:
+            _invalidate_agent(self.client)
+        return AGENT_ADAPTER.validate_python(response["data"])
+
+    async def get_agent(self, agent_id: str) -> Agent:
+        """Get agent by ID.
+
+        Args:
+            agent_id: Agent UUID
+
+        Returns:
+            Agent details
+        """
+        response = await self.client.get(
+            _PATH_ITEM.format(id=agent_id),
+            cache_ttl=self.client.cache_ttl,
+        )
+        return AGENT_ADAPTER.validate_python(response["data"])
+
+    async def update_agent(
+        self,
+        agent_id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Agent:
+        """Update agent.
+
+        Args:
+            agent_id: Agent UUID
+            name: New agent name
+            description: New description
+            status: New status (draft, published, archived)
+
+        Returns:
+            Updated agent
+        """
+        payload = {}
+        if name is not None:
+            payload["name"] = name
+        if description is not None:
+            payload["description"] = description
+        if status is not None:
+            payload["status"] = status
+
+        if not payload:
+            raise ValueError("At least one field must be provided for update")
+
+        try:
+            response = await self.client.put(
+                _PATH_ITEM.format(id=agent_id), json=payload
+            )
+        finally:
+            _invalidate_agent(self.client, agent_id)
+        return AGENT_ADAPTER.validate_python(response["data"])
+
+    async def delete_agent(self, agent_id: str) -> None:
+        """Delete agent.
+
+        Args:
+            agent_id: Agent UUID
+        """
+        try:
+            await self.client.delete(_PATH_ITEM.format(id=agent_id))
+        finally:
+            _invalidate_agent(self.client, agent_id)
+
+    async def get_agent_spec(self, agent_id: str) -> dict[str, Any]:
+        """Get agent specification.
+
+        Args:
+            agent_id: Agent UUID
+
+        Returns:
+            Agent specification (tool definitions, etc.)
+        """
+        response = await self.client.get(
+            _PATH_SPEC.format(id=agent_id),
+            cache_ttl=self.client.cache_ttl,
+        )
+        return response.get("data", {})
+
+    async def iter_agent_spec_tools(
+        self,
+        agent_id: str,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream the tool definitions of an agent specification.
+
+        Use instead of :meth:`get_agent_spec` for large generated specs:
+        tools are yielded as they are parsed rather than after the whole
+        specification has been downloaded and decoded.
+
+        Args:
+            agent_id: Agent UUID
+
+        Yields:
+            Tool definitions
+        """
+        async for tool in self.client.stream_get(
+            _PATH_SPEC.format(id=agent_id),
+            "data.tools.item",
+        ):
+            yield tool
+
+    async def get_agent_generation_status(self, agent_id: str) -> dict[str, Any]:
+        """Get agent generation status.
+
+        Args:
+            agent_id: Agent UUID
+
+        Returns:
+            Generation status (job_id, status, etc.)
+        """
+        response = await self.client.get(_PATH_GENERATION_STATUS.format(id=agent_id))
+        return response.get("data", {})
+
+    async def publish_agent(self, agent_id: str) -> Agent:
+        """Publish agent to production.
+
+        Args:
+            agent_id: Agent UUID
+
+        Returns:
+            Published agent
+        """
+        try:
+            response = await self.client.post(
+                _PATH_PUBLISH.format(id=agent_id), json={}
+            )
+        finally:
+            _invalidate_agent(self.client, agent_id)
+        return AGENT_ADAPTER.validate_python(response["data"])
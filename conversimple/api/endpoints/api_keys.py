@@ -1,9 +1,27 @@
 """API key management endpoints."""
 
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
+from conversimple.api._adapters import API_KEY_INFO_ADAPTER, API_KEY_USAGE_ADAPTER
 from conversimple.api.models import ApiKeyInfo, ApiKeyUsage
 
+if TYPE_CHECKING:
+    from conversimple.api.client import AsyncHTTPClient, HTTPClient
+
+
+_PATH_INFO = "/api/v1/settings/api-key"
+_PATH_ROTATE = "/api/v1/settings/api-key/rotate"
+_PATH_USAGE = "/api/v1/settings/api-key/usage"
+
+_USAGE_CACHE_TTL = 5.0
+"""Seconds usage statistics stay cached; kept short since they change constantly."""
+
+
+def _invalidate_api_key(client: Any) -> None:
+    """Drop cached API key info and usage after the key changes."""
+    client.invalidate(_PATH_INFO)
+    client.invalidate(_PATH_USAGE)
+
 
 class ApiKeyEndpoint:
     """API key management endpoints."""
@@ -22,8 +40,11 @@ class ApiKeyEndpoint:
         Returns:
             API key information
         """
-        response = self.client.get("/api/v1/settings/api-key")
-        return ApiKeyInfo(**response["data"])
+        response = self.client.get(
+            _PATH_INFO,
+            cache_ttl=self.client.cache_ttl,
+        )
+        return API_KEY_INFO_ADAPTER.validate_python(response["data"])
 
     def rotate_api_key(self) -> dict[str, str]:
         """Rotate API key.
@@ -31,7 +52,10 @@ class ApiKeyEndpoint:
         Returns:
             Dictionary containing new_api_key
         """
-        response = self.client.post("/api/v1/settings/api-key/rotate", json={})
+        try:
+            response = self.client.post(_PATH_ROTATE, json={})
+        finally:
+            _invalidate_api_key(self.client)
         return response.get("data", {})
 
     def get_api_key_usage(self) -> ApiKeyUsage:
@@ -40,5 +64,56 @@ class ApiKeyEndpoint:
         Returns:
             API key usage statistics
         """
-        response = self.client.get("/api/v1/settings/api-key/usage")
-        return ApiKeyUsage(**response["data"])
+        response = self.client.get(
+            _PATH_USAGE,
+            cache_ttl=_USAGE_CACHE_TTL,
+        )
+        return API_KEY_USAGE_ADAPTER.validate_python(response["data"])
+
+
+class AsyncApiKeyEndpoint:
+    """Async API key management endpoints."""
+
+    def __init__(self, client: "AsyncHTTPClient"):
+        """Initialize async API key endpoint.
+
+        Args:
+            client: Async HTTP client instance
+        """
+        self.client = client
+
+    async def get_api_key_info(self) -> ApiKeyInfo:
+        """Get API key information.
+
+        Returns:
+            API key information
+        """
+        response = await self.client.get(
+            _PATH_INFO,
+            cache_ttl=self.client.cache_ttl,
+        )
+        return API_KEY_INFO_ADAPTER.validate_python(response["data"])
+
+    async def rotate_api_key(self) -> dict[str, str]:
+        """Rotate API key.
+
+        Returns:
+            Dictionary containing new_api_key
+        """
+        try:
+            response = await self.client.post(_PATH_ROTATE, json={})
+        finally:
+            _invalidate_api_key(self.client)
+        return response.get("data", {})
+
+    async def get_api_key_usage(self) -> ApiKeyUsage:
+        """Get API key usage statistics.
+
+        Returns:
+            API key usage statistics
+        """
+        response = await self.client.get(
+            _PATH_USAGE,
+            cache_ttl=_USAGE_CACHE_TTL,
+        )
+        return API_KEY_USAGE_ADAPTER.validate_python(response["data"])
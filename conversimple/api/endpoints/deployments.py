@@ -1,9 +1,58 @@
 """Deployment management endpoints."""
 
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Iterator, Optional, TYPE_CHECKING
 
+from conversimple.api._adapters import DEPLOYMENT_ADAPTER, DEPLOYMENT_LIST_ADAPTER
+from conversimple.api._pagination import (
+    aiter_prefetched,
+    aiter_streamed,
+    iter_prefetched,
+    iter_streamed,
+)
 from conversimple.api.models import Deployment
 
+if TYPE_CHECKING:
+    from conversimple.api.client import AsyncHTTPClient, HTTPClient
+
+
+_PATH_LIST = "/api/v1/deployments"
+_PATH_ITEM = "/api/v1/deployments/{id}"
+_PATH_ACTIVATE = "/api/v1/deployments/{id}/activate"
+_PATH_DEACTIVATE = "/api/v1/deployments/{id}/deactivate"
+
+_LIST_CACHE_TTL = 5.0
+"""Seconds list responses stay cached; kept short since lists change often."""
+
+
+def _list_params(
+    per_page: int,
+    agent_id: Optional[str],
+    status: Optional[str],
+    environment: Optional[str],
+) -> dict[str, Any]:
+    """Build list query parameters, leaving out unset filters."""
+    params: dict[str, Any] = {"per_page": per_page}
+    if agent_id:
+        params["agent_id"] = agent_id
+    if status:
+        params["status"] = status
+    if environment:
+        params["environment"] = environment
+    return params
+
+
+def _invalidate_deployment(client: Any, deployment_id: Optional[str] = None) -> None:
+    """Drop cached reads made stale by a change to a deployment.
+
+    Every deployment mutation invalidates the deployment lists; when
+    ``deployment_id`` is given, that deployment too.
+    Mutations call this even when they fail, since a timed-out or rejected
+    request may still have changed (or revealed a change to) server state.
+    """
+    client.invalidate(_PATH_LIST)
+    if deployment_id is not None:
+        client.invalidate(_PATH_ITEM.format(id=deployment_id))
+
 
 class DeploymentEndpoint:
     """Deployment management endpoints."""
@@ -38,20 +87,60 @@ class DeploymentEndpoint:
         """
         params = {
             "page": page,
-            "per_page": per_page,
+            **_list_params(per_page, agent_id, status, environment),
         }
-        if agent_id:
-            params["agent_id"] = agent_id
-        if status:
-            params["status"] = status
-        if environment:
-            params["environment"] = environment
-
-        response = self.client.get("/api/v1/deployments", params=params)
-        deployments = [Deployment(**dep_data) for dep_data in response["data"]]
+        response = self.client.get(
+            _PATH_LIST,
+            params=params,
+            cache_ttl=_LIST_CACHE_TTL,
+        )
+        deployments = DEPLOYMENT_LIST_ADAPTER.validate_python(response["data"])
         meta = response.get("meta", {})
         return deployments, meta
 
+    def iter_deployments(
+        self,
+        per_page: int = 100,
+        agent_id: Optional[str] = None,
+        status: Optional[str] = None,
+        environment: Optional[str] = None,
+        prefetch: bool = True,
+    ) -> Iterator[Deployment]:
+        """Iterate over all deployments, fetching pages as needed.
+
+        By default the next page is requested in the background while the
+        current one is being consumed. With ``prefetch=False`` pages are
+        instead streamed one at a time and deployments yielded as they are
+        parsed, keeping memory proportional to a single deployment.
+
+        Args:
+            per_page: Items fetched per request (default: 100)
+            agent_id: Filter by agent ID
+            status: Filter by status (pending, active, inactive)
+            environment: Filter by environment (dev, staging, production, widget)
+            prefetch: Overlap fetching the next page with consuming this one
+
+        Yields:
+            Deployments in listing order
+        """
+        if prefetch:
+            yield from iter_prefetched(
+                lambda page: self.list_deployments(
+                    page, per_page, agent_id, status, environment
+                ),
+                per_page,
+            )
+            return
+
+        params = _list_params(per_page, agent_id, status, environment)
+        for deployment_data in iter_streamed(
+            lambda page, meta: self.client.stream_get(
+                _PATH_LIST, "data.item", params={**params, "page": page}, meta=meta
+            ),
+            per_page,
+        ):
+            yield DEPLOYMENT_ADAPTER.validate_python(deployment_data)
+
     def create_deployment(
         self,
         name: str,
@@ -76,7 +165,7 @@ class DeploymentEndpoint:
         Returns:
             Created deployment
         """
-        payload = {
+        payload: dict[str, Any] = {
             "name": name,
             "agent_id": agent_id,
             "channel": channel,
@@ -89,8 +178,11 @@ class DeploymentEndpoint:
         if call_direction:
             payload["call_direction"] = call_direction
 
-        response = self.client.post("/api/v1/deployments", json=payload)
-        return Deployment(**response["data"])
+        try:
+            response = self.client.post(_PATH_LIST, json=payload)
+        finally:
+            _invalidate_deployment(self.client)
+        return DEPLOYMENT_ADAPTER.validate_python(response["data"])
 
     def get_deployment(self, deployment_id: str) -> Deployment:
         """Get deployment by ID.
@@ -101,8 +193,11 @@ class DeploymentEndpoint:
         Returns:
             Deployment details
         """
-        response = self.client.get(f"/api/v1/deployments/{deployment_id}")
-        return Deployment(**response["data"])
+        response = self.client.get(
+            _PATH_ITEM.format(id=deployment_id),
+            cache_ttl=self.client.cache_ttl,
+        )
+        return DEPLOYMENT_ADAPTER.validate_python(response["data"])
 
     def update_deployment(
         self,
@@ -129,8 +224,13 @@ class DeploymentEndpoint:
         if not payload:
             raise ValueError("At least one field must be provided for update")
 
-        response = self.client.put(f"/api/v1/deployments/{deployment_id}", json=payload)
-        return Deployment(**response["data"])
+        try:
+            response = self.client.put(
+                _PATH_ITEM.format(id=deployment_id), json=payload
+            )
+        finally:
+            _invalidate_deployment(self.client, deployment_id)
+        return DEPLOYMENT_ADAPTER.validate_python(response["data"])
 
     def delete_deployment(self, deployment_id: str) -> None:
         """Delete deployment.
@@ -138,7 +238,10 @@ class DeploymentEndpoint:
         Args:
             deployment_id: Deployment UUID
         """
-        self.client.delete(f"/api/v1/deployments/{deployment_id}")
+        try:
+            self.client.delete(_PATH_ITEM.format(id=deployment_id))
+        finally:
+            _invalidate_deployment(self.client, deployment_id)
 
     def activate_deployment(self, deployment_id: str) -> Deployment:
         """Activate deployment.
@@ -149,11 +252,14 @@ class DeploymentEndpoint:
         Returns:
             Activated deployment
         """
-        response = self.client.post(
-            f"/api/v1/deployments/{deployment_id}/activate",
-            json={},
-        )
-        return Deployment(**response["data"])
+        try:
+            response = self.client.post(
+                _PATH_ACTIVATE.format(id=deployment_id),
+                json={},
+            )
+        finally:
+            _invalidate_deployment(self.client, deployment_id)
+        return DEPLOYMENT_ADAPTER.validate_python(response["data"])
 
     def deactivate_deployment(self, deployment_id: str) -> Deployment:
         """Deactivate deployment.
@@ -164,8 +270,239 @@ class DeploymentEndpoint:
         Returns:
             Deactivated deployment
         """
-        response = self.client.post(
-            f"/api/v1/deployments/{deployment_id}/deactivate",
-            json={},
+        try:
+            response = self.client.post(
+                _PATH_DEACTIVATE.format(id=deployment_id),
+                json={},
+            )
+        finally:
+            _invalidate_deployment(self.client, deployment_id)
+        return DEPLOYMENT_ADAPTER.validate_python(response["data"])
+
+
+class AsyncDeploymentEndpoint:
+    """Async deployment management endpoints."""
+
+    def __init__(self, client: "AsyncHTTPClient"):
+        """Initialize async deployment endpoint.
+
+        Args:
+            client: Async HTTP client instance
+        """
+        self.client = client
+
+    async def list_deployments(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        agent_id: Optional[str] = None,
+        status: Optional[str] = None,
+        environment: Optional[str] = None,
+    ) -> tuple[list[Deployment], dict[str, Any]]:
+        """List deployments with pagination and filtering.
+
+        Args:
+            page: Page number (default: 1)
+            per_page: Items per page (default: 20)
+            agent_id: Filter by agent ID
+            status: Filter by status (pending, active, inactive)
+            environment: Filter by environment (dev, staging, production, widget)
+
+        Returns:
+            Tuple of (deployments list, pagination metadata)
+        """
+        params = {
+            "page": page,
+            **_list_params(per_page, agent_id, status, environment),
+        }
+        response = await self.client.get(
+            _PATH_LIST,
+            params=params,
+            cache_ttl=_LIST_CACHE_TTL,
         )
-        return Deployment(**response["data"])
+        deployments = DEPLOYMENT_LIST_ADAPTER.validate_python(response["data"])
+        meta = response.get("meta", {})
+        return deployments, meta
+
+    async def iter_deployments(
+        self,
+        per_page: int = 100,
+        agent_id: Optional[str] = None,
+        status: Optional[str] = None,
+        environment: Optional[str] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Deployment]:
+        """Iterate over all deployments, fetching pages as needed.
+
+        By default the next page is requested in the background while the
+        current one is being consumed. With ``prefetch=False`` pages are
+        instead streamed one at a time and deployments yielded as they are
+        parsed, keeping memory proportional to a single deployment.
+
+        Args:
+            per_page: Items fetched per request (default: 100)
+            agent_id: Filter by agent ID
+            status: Filter by status (pending, active, inactive)
+            environment: Filter by environment (dev, staging, production, widget)
+            prefetch: Overlap fetching the next page with consuming this one
+
+        Yields:
+            Deployments in listing order
+        """
+        if prefetch:
+            async for deployment in aiter_prefetched(
+                lambda page: self.list_deployments(
+                    page, per_page, agent_id, status, environment
+                ),
+                per_page,
+            ):
+                yield deployment
+            return
+
+        params = _list_params(per_page, agent_id, status, environment)
+        async for deployment_data in aiter_streamed(
+            lambda page, meta: self.client.stream_get(
+                _PATH_LIST, "data.item", params={**params, "page": page}, meta=meta
+            ),
+            per_page,
+        ):
+            yield DEPLOYMENT_ADAPTER.validate_python(deployment_data)
+
+    async def create_deployment(
+        self,
+        name: str,
+        agent_id: str,
+        channel: str,
+        environment: str = "widget",
+        channel_config: Optional[dict[str, Any]] = None,
+        engagement_rules: Optional[dict[str, Any]] = None,
+        call_direction: Optional[str] = None,
+    ) -> Deployment:
+        """Create a new deployment.
+
+        Args:
+            name: Deployment name
+            agent_id: Agent ID to deploy
+            channel: Channel type (phone, widget, inline, sdk)
+            environment: Environment (dev, staging, production, widget)
+            channel_config: Channel-specific configuration
+            engagement_rules: Engagement rules
+            call_direction: Call direction (inbound, outbound)
+
+        Returns:
+            Created deployment
+        """
+        payload: dict[str, Any] = {
+            "name": name,
+            "agent_id": agent_id,
+            "channel": channel,
+            "environment": environment,
+        }
+        if channel_config:
+            payload["channel_config"] = channel_config
+        if engagement_rules:
+            payload["engagement_rules"] = engagement_rules
+        if call_direction:
+            payload["call_direction"] = call_direction
+
+        try:
+            response = await self.client.post(_PATH_LIST, json=payload)
+        finally:
+            _invalidate_deployment(self.client)
+        return DEPLOYMENT_ADAPTER.validate_python(response["data"])
+
+    async def get_deployment(self, deployment_id: str) -> Deployment:
+        """Get deployment by ID.
+
+        Args:
+            deployment_id: Deployment UUID
+
+        Returns:
+            Deployment details
+        """
+        response = await self.client.get(
+            _PATH_ITEM.format(id=deployment_id),
+            cache_ttl=self.client.cache_ttl,
+        )
+        return DEPLOYMENT_ADAPTER.validate_python(response["data"])
+
+    async def update_deployment(
+        self,
+        deployment_id: str,
+        name: Optional[str] = None,
+        environment: Optional[str] = None,
+    ) -> Deployment:
+        """Update deployment.
+
+        Args:
+            deployment_id: Deployment UUID
+            name: New deployment name
+            environment: New environment
+
+        Returns:
+            Updated deployment
+        """
+        payload = {}
+        if name is not None:
+            payload["name"] = name
+        if environment is not None:
+            payload["environment"] = environment
+
+        if not payload:
+            raise ValueError("At least one field must be provided for update")
+
+        try:
+            response = await self.client.put(
+                _PATH_ITEM.format(id=deployment_id),
+                json=payload,
+            )
+        finally:
+            _invalidate_deployment(self.client, deployment_id)
+        return DEPLOYMENT_ADAPTER.validate_python(response["data"])
+
+    async def delete_deployment(self, deployment_id: str) -> None:
+        """Delete deployment.
+
+        Args:
+            deployment_id: Deployment UUID
+        """
+        try:
+            await self.client.delete(_PATH_ITEM.format(id=deployment_id))
+        finally:
+            _invalidate_deployment(self.client, deployment_id)
+
+    async def activate_deployment(self, deployment_id: str) -> Deployment:
+        """Activate deployment.
+
+        Args:
+            deployment_id: Deployment UUID
+
+        Returns:
+            Activated deployment
+        """
+        try:
+            response = await self.client.post(
+                _PATH_ACTIVATE.format(id=deployment_id),
+                json={},
+            )
+        finally:
+            _invalidate_deployment(self.client, deployment_id)
+        return DEPLOYMENT_ADAPTER.validate_python(response["data"])
+
+    async def deactivate_deployment(self, deployment_id: str) -> Deployment:
+        """Deactivate deployment.
+
+        Args:
+            deployment_id: Deployment UUID
+
+        Returns:
+            Deactivated deployment
+        """
+        try:
+            response = await self.client.post(
+                _PATH_DEACTIVATE.format(id=deployment_id),
+                json={},
+            )
+        finally:
+            _invalidate_deployment(self.client, deployment_id)
+        return DEPLOYMENT_ADAPTER.validate_python(response["data"])
@@ -6,89 +6,82 @@ from typing import Any
 class APIError(Exception):
     """Base exception for API errors."""
 
+    DEFAULT_MESSAGE = "API request failed"
+    """Message used when none is given."""
+
+    DEFAULT_STATUS_CODE: int | None = None
+    """Status code used when none is given."""
+
     def __init__(
         self,
-        message: str,
+        message: str | None = None,
         status_code: int | None = None,
         response_data: dict[str, Any] | None = None,
     ):
         """Initialize APIError.
 
         Args:
-            message: Error message
-            status_code: HTTP status code
+            message: Error message (defaults to DEFAULT_MESSAGE)
+            status_code: HTTP status code (defaults to DEFAULT_STATUS_CODE)
             response_data: Response data from API
         """
-        self.message = message
-        self.status_code = status_code
+        self.message = message or self.DEFAULT_MESSAGE
+        self.status_code = (
+            status_code if status_code is not None else self.DEFAULT_STATUS_CODE
+        )
         self.response_data = response_data or {}
+        self._str = (
+            f"[{self.status_code}] {self.message}" if self.status_code else self.message
+        )
         super().__init__(self.message)
 
     def __str__(self) -> str:
         """Return string representation."""
-        if self.status_code:
-            return f"[{self.status_code}] {self.message}"
-        return self.message
+        return self._str
 
 
 class ValidationError(APIError):
     """Raised when API returns 422 Unprocessable Entity (validation errors)."""
 
+    DEFAULT_MESSAGE = "Validation failed"
+    DEFAULT_STATUS_CODE = 422
+
     def __init__(
         self,
-        message: str = "Validation failed",
-        status_code: int = 422,
+        message: str | None = None,
+        status_code: int | None = None,
         response_data: dict[str, Any] | None = None,
     ):
         """Initialize ValidationError."""
         super().__init__(message, status_code, response_data)
-        self.errors = response_data.get("errors", {}) if response_data else {}
+        self.errors = self.response_data.get("errors", {})
 
     def __str__(self) -> str:
         """Return string representation with field errors."""
-        base = super().__str__()
         if self.errors:
             errors_str = "\n".join(
                 f"  {field}: {error}" for field, error in self.errors.items()
             )
-            return f"{base}\n{errors_str}"
-        return base
+            return f"{self._str}\n{errors_str}"
+        return self._str
 
 
 class NotFoundError(APIError):
     """Raised when API returns 404 Not Found."""
 
-    def __init__(
-        self,
-        message: str = "Resource not found",
-        status_code: int = 404,
-        response_data: dict[str, Any] | None = None,
-    ):
-        """Initialize NotFoundError."""
-        super().__init__(message, status_code, response_data)
+    DEFAULT_MESSAGE = "Resource not found"
+    DEFAULT_STATUS_CODE = 404
 
 
 class UnauthorizedError(APIError):
     """Raised when API returns 401 Unauthorized."""
 
-    def __init__(
-        self,
-        message: str = "Unauthorized - invalid or missing API key",
-        status_code: int = 401,
-        response_data: dict[str, Any] | None = None,
-    ):
-        """Initialize UnauthorizedError."""
-        super().__init__(message, status_code, response_data)
+    DEFAULT_MESSAGE = "Unauthorized - invalid or missing API key"
+    DEFAULT_STATUS_CODE = 401
 
 
 class ForbiddenError(APIError):
     """Raised when API returns 403 Forbidden."""
 
-    def __init__(
-        self,
-        message: str = "Forbidden - you do not have permission to access this resource",
-        status_code: int = 403,
-        response_data: dict[str, Any] | None = None,
-    ):
-        """Initialize ForbiddenError."""
-        super().__init__(message, status_code, response_data)
+    DEFAULT_MESSAGE = "Forbidden - you do not have permission to access this resource"
+    DEFAULT_STATUS_CODE = 403
@@ -1,12 +1,47 @@
 """Data models for Conversimple Platform API responses."""
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Annotated, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
 
+try:
+    import ciso8601  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # optional dependency: pip install conversimple-sdk[speedups]
+    ciso8601 = None
 
-class ListResponse(BaseModel):
+
+def _parse_datetime(value: Any) -> Any:
+    """Parse ISO-8601 strings with ciso8601 when it is installed.
+
+    Anything else, strings ciso8601 rejects (such as Unix timestamps), or
+    every value when ciso8601 is missing, is left to pydantic's own datetime
+    validation.
+    """
+    if ciso8601 is not None and isinstance(value, str):
+        try:
+            return ciso8601.parse_datetime(value)
+        except ValueError:
+            pass
+    return value
+
+
+Timestamp = Annotated[datetime, BeforeValidator(_parse_datetime)]
+"""Datetime field type parsed by ciso8601 when available."""
+
+
+class _APIModel(BaseModel):
+    """Base for API response models.
+
+    Models are immutable snapshots of server state: they can be shared
+    between threads and cached without copying, and fields added by newer
+    API versions are ignored.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore", populate_by_name=True)
+
+
+class ListResponse(_APIModel):
     """Pagination metadata for list responses."""
 
     page: int
@@ -14,7 +49,7 @@ class ListResponse(BaseModel):
     total_count: int
 
 
-class Agent(BaseModel):
+class Agent(_APIModel):
     """Agent resource model."""
 
     id: str
@@ -22,14 +57,14 @@ class Agent(BaseModel):
     description: str
     status: str  # draft, published, archived
     version: int
-    created_at: datetime
-    updated_at: datetime
+    created_at: Timestamp
+    updated_at: Timestamp
     spec: Optional[dict[str, Any]] = None  # Generated agent specification
     agent_config: Optional[dict[str, Any]] = None  # Agent configuration
     execution_mode: Optional[str] = None  # dialog_manager, free_flow, free_flow_native_sts
 
 
-class Deployment(BaseModel):
+class Deployment(_APIModel):
     """Deployment resource model."""
 
     id: str
@@ -40,30 +75,30 @@ class Deployment(BaseModel):
     environment: str  # dev, staging, production, widget
     channel_config: Optional[dict[str, Any]] = None
     engagement_rules: Optional[dict[str, Any]] = None
-    created_at: datetime
-    updated_at: datetime
+    created_at: Timestamp
+    updated_at: Timestamp
 
 
-class ApiKeyInfo(BaseModel):
+class ApiKeyInfo(_APIModel):
     """API key information."""
 
     status: str  # active, rotated, expired
     last_4_chars: str = Field(..., alias="last_4")
-    created_at: datetime
-    last_used_at: Optional[datetime] = None
+    created_at: Timestamp
+    last_used_at: Optional[Timestamp] = None
 
 
-class ApiKeyUsage(BaseModel):
+class ApiKeyUsage(_APIModel):
     """API key usage statistics."""
 
     requests_24h: int
     requests_month: int
     rate_limit: int
     rate_limit_remaining: int
-    last_request_at: Optional[datetime] = None
+    last_request_at: Optional[Timestamp] = None
 
 
-class AgentListResponse(BaseModel):
+class AgentListResponse(_APIModel):
     """Response for list agents endpoint."""
 
     success: bool
@@ -71,14 +106,14 @@ class AgentListResponse(BaseModel):
     meta: ListResponse
 
 
-class AgentResponse(BaseModel):
+class AgentResponse(_APIModel):
     """Response for single agent endpoint."""
 
     success: bool
     data: Agent
 
 
-class DeploymentListResponse(BaseModel):
+class DeploymentListResponse(_APIModel):
     """Response for list deployments endpoint."""
 
     success: bool
@@ -86,28 +121,28 @@ class DeploymentListResponse(BaseModel):
     meta: ListResponse
 
 
-class DeploymentResponse(BaseModel):
+class DeploymentResponse(_APIModel):
     """Response for single deployment endpoint."""
 
     success: bool
     data: Deployment
 
 
-class ApiKeyInfoResponse(BaseModel):
+class ApiKeyInfoResponse(_APIModel):
     """Response for API key info endpoint."""
 
     success: bool
     data: ApiKeyInfo
 
 
-class ApiKeyUsageResponse(BaseModel):
+class ApiKeyUsageResponse(_APIModel):
     """Response for API key usage endpoint."""
 
     success: bool
     data: ApiKeyUsage
 
 
-class ApiKeyRotateResponse(BaseModel):
+class ApiKeyRotateResponse(_APIModel):
     """Response for API key rotate endpoint."""
 
     success: bool
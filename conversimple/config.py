@@ -1,82 +1,178 @@
 """Configuration management for Conversimple SDK."""
 
 import os
-from typing import Optional
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def _as_bool(value: Any) -> bool:
+    """Interpret "true"/"1"/"yes" (any case) as True; other values by truthiness."""
+    if isinstance(value, str):
+        return value.lower() in ("true", "1", "yes")
+    return bool(value)
+
+
+class _Setting(Generic[T]):
+    """Config attribute read from its environment variable on first access.
+
+    The cast value is cached until :meth:`Config.invalidate` is called, so
+    environment variables set after importing the SDK are still honoured.
+    Values passed to :meth:`Config.update` go through the same cast and take
+    precedence over the environment.
+    """
+
+    _UNSET = object()
+
+    def __init__(
+        self,
+        env: Optional[str],
+        default: T,
+        cast: Callable[[Any], T],
+    ):
+        """Initialize setting.
+
+        Args:
+            env: Environment variable to read, or None for code-only settings
+            default: Value used when the variable is unset
+            cast: Converts raw (usually string) values to the setting's type
+        """
+        self.env = env
+        self.default = default
+        self.cast = cast
+        self._override: Any = self._UNSET
+        self._cached: Any = self._UNSET
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> T:
+        if self._override is not self._UNSET:
+            return self._override
+        if self._cached is self._UNSET:
+            raw = os.getenv(self.env) if self.env else None
+            self._cached = self.default if raw is None else self.cast(raw)
+        return self._cached
+
+    def set(self, value: Any) -> None:
+        """Override the setting, casting the value to the setting's type."""
+        self._override = None if value is None else self.cast(value)
+
+    def invalidate(self) -> None:
+        """Forget the cached environment value so the next access re-reads it."""
+        self._cached = self._UNSET
 
 
 class Config:
-    """SDK configuration with environment variable support."""
+    """SDK configuration with environment variable support.
+
+    Settings are read from the environment on first access and cached; call
+    :meth:`invalidate` after changing environment variables at runtime.
+    """
 
     # API Configuration
-    API_ENDPOINT: str = os.getenv(
+    API_ENDPOINT = _Setting(
         "CONVERSIMPLE_API_ENDPOINT",
-        "https://api.conversimple.com"
+        "https://api.conversimple.com",
+        str,
     )
     """Platform API endpoint URL."""
 
     # Platform WebSocket Configuration
-    PLATFORM_URL: str = os.getenv(
+    PLATFORM_URL = _Setting(
         "CONVERSIMPLE_PLATFORM_URL",
-        "wss://api.conversimple.com/sdk/websocket"
+        "wss://api.conversimple.com/sdk/websocket",
+        str,
     )
     """Platform WebSocket URL for agent communication."""
 
     # Authentication
-    API_KEY: Optional[str] = os.getenv("CONVERSIMPLE_API_KEY")
+    API_KEY = _Setting[Optional[str]]("CONVERSIMPLE_API_KEY", None, str)
     """API key for authentication (from environment or config file)."""
 
-    CUSTOMER_ID: Optional[str] = os.getenv("CONVERSIMPLE_CUSTOMER_ID")
+    CUSTOMER_ID = _Setting[Optional[str]]("CONVERSIMPLE_CUSTOMER_ID", None, str)
     """Customer ID (optional, can be derived from API key)."""
 
     # Logging
-    LOG_LEVEL: str = os.getenv("CONVERSIMPLE_LOG_LEVEL", "INFO")
+    LOG_LEVEL = _Setting("CONVERSIMPLE_LOG_LEVEL", "INFO", str)
     """Log level for SDK logging."""
 
     # Client Configuration
-    API_TIMEOUT: int = int(os.getenv("CONVERSIMPLE_API_TIMEOUT", "30"))
+    API_TIMEOUT = _Setting("CONVERSIMPLE_API_TIMEOUT", 30, int)
     """HTTP request timeout in seconds."""
 
-    VERBOSE: bool = os.getenv("CONVERSIMPLE_VERBOSE", "").lower() in ("true", "1", "yes")
+    VERBOSE = _Setting("CONVERSIMPLE_VERBOSE", False, _as_bool)
     """Enable verbose logging."""
 
+    HTTPX_MAX_CONNECTIONS = _Setting("CONVERSIMPLE_HTTPX_MAX_CONNECTIONS", 100, int)
+    """Maximum number of concurrent HTTP connections per API client."""
+
+    HTTPX_MAX_KEEPALIVE = _Setting("CONVERSIMPLE_HTTPX_MAX_KEEPALIVE", 20, int)
+    """Maximum number of idle keep-alive connections per API client."""
+
+    HTTPX_HTTP2 = _Setting("CONVERSIMPLE_HTTPX_HTTP2", False, _as_bool)
+    """Enable HTTP/2 for API clients (requires ``httpx[http2]``)."""
+
+    CACHE_ENABLED = _Setting("CONVERSIMPLE_CACHE_ENABLED", False, _as_bool)
+    """Cache idempotent API reads (get_agent, get_agent_spec, ...) in memory."""
+
+    CACHE_DEFAULT_TTL = _Setting("CONVERSIMPLE_CACHE_DEFAULT_TTL", 60.0, float)
+    """Lifetime in seconds of cached single-resource API reads."""
+
+    MAX_HTTP_RETRIES = _Setting("CONVERSIMPLE_MAX_HTTP_RETRIES", 3, int)
+    """Retries for transient API failures (429, 502-504, network errors)."""
+
+    HTTP_RETRY_BASE_DELAY = _Setting("CONVERSIMPLE_HTTP_RETRY_BASE_DELAY", 0.5, float)
+    """Initial API retry delay in seconds; grows by RECONNECT_BACKOFF per attempt."""
+
     # Connection Configuration
-    HEARTBEAT_INTERVAL: int = int(
-        os.getenv("CONVERSIMPLE_HEARTBEAT_INTERVAL", "30")
-    )
+    HEARTBEAT_INTERVAL = _Setting("CONVERSIMPLE_HEARTBEAT_INTERVAL", 30, int)
     """WebSocket heartbeat interval in seconds."""
 
-    MAX_RECONNECT_ATTEMPTS: Optional[int] = None
+    MAX_RECONNECT_ATTEMPTS = _Setting[Optional[int]](None, None, int)
     """Maximum reconnection attempts (None = infinite)."""
 
-    RECONNECT_BACKOFF: float = float(
-        os.getenv("CONVERSIMPLE_RECONNECT_BACKOFF", "2.0")
-    )
+    RECONNECT_BACKOFF = _Setting("CONVERSIMPLE_RECONNECT_BACKOFF", 2.0, float)
     """Exponential backoff multiplier for reconnection."""
 
-    MAX_BACKOFF: float = float(
-        os.getenv("CONVERSIMPLE_MAX_BACKOFF", "300.0")
-    )
+    MAX_BACKOFF = _Setting("CONVERSIMPLE_MAX_BACKOFF", 300.0, float)
     """Maximum backoff time in seconds."""
 
-    TOTAL_RETRY_DURATION: Optional[float] = None
+    TOTAL_RETRY_DURATION = _Setting[Optional[float]](None, None, float)
     """Total retry duration limit in seconds (None = no limit)."""
 
-    ENABLE_CIRCUIT_BREAKER: bool = os.getenv(
-        "CONVERSIMPLE_ENABLE_CIRCUIT_BREAKER", "true"
-    ).lower() in ("true", "1", "yes")
+    ENABLE_CIRCUIT_BREAKER = _Setting(
+        "CONVERSIMPLE_ENABLE_CIRCUIT_BREAKER", True, _as_bool
+    )
     """Enable circuit breaker for permanent failures."""
 
     @classmethod
     def update(cls, **kwargs) -> None:
         """Update configuration at runtime.
 
+        Values are cast like the matching environment variable, so
+        ``Config.update(API_TIMEOUT="20")`` stores the integer 20.
+
         Args:
             **kwargs: Configuration key-value pairs
         """
         for key, value in kwargs.items():
-            if hasattr(cls, key):
+            setting = cls.__dict__.get(key)
+            if isinstance(setting, _Setting):
+                setting.set(value)
+            elif hasattr(cls, key):
                 setattr(cls, key, value)
 
+    @classmethod
+    def invalidate(cls) -> None:
+        """Re-read environment variables on next access.
+
+        Values set with :meth:`update` are kept.
+        """
+        for setting in vars(cls).values():
+            if isinstance(setting, _Setting):
+                setting.invalidate()
+
     @classmethod
     def get_api_endpoint(cls) -> str:
         """Get API endpoint URL.
@@ -50,15 +50,26 @@ setup(
         "aiohttp>=3.8.0",
         "httpx>=0.24.0",
         "pydantic>=2.0",
+        "orjson>=3.8",
     ],
     extras_require={
         "dev": [
             "pytest>=7.0",
             "pytest-asyncio>=0.21.0",
+            "pytest-xdist>=3.0",
             "black>=23.0",
             "flake8>=6.0",
             "mypy>=1.0",
         ],
+        "http2": [
+            "httpx[http2]>=0.24.0",
+        ],
+        "stream": [
+            "ijson>=3.1",
+        ],
+        "speedups": [
+            "ciso8601>=2.3",
+        ],
         "examples": [
             "aiofiles>=23.0",
             "aiohttp>=3.8.0",
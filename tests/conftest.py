@@ -0,0 +1,60 @@
+"""Shared fixtures for the Conversimple SDK tests.
+
+The suite can run under pytest-xdist. Nothing here is shared between worker
+processes: each worker builds its own session ``client``, and response
+fakes are installed per test or per class on that worker's client only.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from conversimple import PlatformClient
+from fake_transport import FakeTransport
+
+
+@pytest.fixture(scope="session")
+def client():
+    """PlatformClient shared by every test that needs no custom settings."""
+    client = PlatformClient(api_key="test-key")
+    yield client
+    client.close()
+
+
+@pytest.fixture(autouse=True)
+def mocked_responses(client):
+    """Serve canned responses to ``client``; register them with ``.add()``."""
+    with FakeTransport().installed(client._http_client) as transport:
+        yield transport
+
+
+@pytest.fixture(scope="class")
+def class_responses(client):
+    """Canned responses shared by a whole test class.
+
+    Classes whose tests only read pre-registered responses register them
+    in a class-scoped fixture built on this one and override
+    ``mocked_responses`` to return it, so registrations happen once per class.
+    """
+    with FakeTransport().installed(client._http_client) as transport:
+        yield transport
+
+
+@pytest.fixture
+def fake_http(client, monkeypatch):
+    """Stub out the HTTP layer of ``client`` entirely.
+
+    Every request returns ``fake_http.next_return`` as its decoded JSON body,
+    increments ``fake_http.count`` and is recorded in ``fake_http.calls`` as
+    ``(method, path, kwargs)``. Use it for tests that check model decoding
+    rather than HTTP wiring.
+    """
+    fake = SimpleNamespace(calls=[], count=0, next_return={})
+
+    def request(method, path, **kwargs):
+        fake.count += 1
+        fake.calls.append((method, path, kwargs))
+        return fake.next_return
+
+    monkeypatch.setattr(client._http_client, "_request", request)
+    return fake
@@ -0,0 +1,90 @@
+"""Dict-routed httpx transport for serving canned API responses in tests."""
+
+import contextlib
+from typing import Any, Iterator, Optional
+
+import httpx
+
+
+class FakeTransport(httpx.BaseTransport):
+    """Serve registered responses keyed on (method, URL without query).
+
+    Requests are looked up in a dict, so dispatch cost does not grow with the
+    number of registered routes. Every request is recorded in :attr:`calls`.
+    """
+
+    def __init__(self):
+        """Initialize transport with no routes."""
+        self.routes: dict[tuple[str, str], tuple[int, Any]] = {}
+        self.calls: list[httpx.Request] = []
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        json: Optional[Any] = None,
+        status: int = 200,
+    ) -> None:
+        """Register the response for a method and URL.
+
+        Args:
+            method: HTTP method (e.g., "GET")
+            url: Absolute URL without query string
+            json: Response body
+            status: Response status code
+        """
+        self.routes[(method, url)] = (status, json)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(request)
+        url = str(request.url.copy_with(query=None))
+        try:
+            status, body = self.routes[(request.method, url)]
+        except KeyError:
+            raise LookupError(f"No fake response for {request.method} {url}") from None
+        return httpx.Response(status, json=body, request=request)
+
+    @contextlib.contextmanager
+    def installed(self, http_client: Any) -> Iterator["FakeTransport"]:
+        """Route an HTTPClient's requests through this transport.
+
+        Args:
+            http_client: ``PlatformClient._http_client`` to patch
+
+        Yields:
+            This transport
+        """
+        original = http_client._client
+        http_client._client = httpx.Client(
+            base_url=original.base_url,
+            headers=original.headers,
+            transport=self,
+        )
+        try:
+            yield self
+        finally:
+            http_client._client.close()
+            http_client._client = original
+
+
+def route_to_handler(http_client: Any, handler: Any, monkeypatch: Any) -> None:
+    """Send an HTTP client's requests to ``handler`` for the rest of a test.
+
+    Works for both the sync and async HTTP clients; the patched httpx client
+    is restored by ``monkeypatch`` at teardown.
+
+    Args:
+        http_client: ``PlatformClient._http_client`` (or the async variant)
+        handler: Called with each ``httpx.Request``; returns an ``httpx.Response``
+        monkeypatch: The test's monkeypatch fixture
+    """
+    original = http_client._client
+    monkeypatch.setattr(
+        http_client,
+        "_client",
+        type(original)(
+            base_url=original.base_url,
+            headers=original.headers,
+            transport=httpx.MockTransport(handler),
+        ),
+    )
@@ -1,15 +1,19 @@
 """Tests for Conversimple Platform API Client."""
 
 import json
+import pickle
+import subprocess
+import sys
 from datetime import datetime
+from types import SimpleNamespace
 
+import httpx
 import pytest
-import responses
+from pydantic import ValidationError as PydanticValidationError
 
 from conversimple import (
+    AsyncPlatformClient,
     PlatformClient,
-    Agent,
-    Deployment,
     ApiKeyInfo,
     ApiKeyUsage,
     APIError,
@@ -18,18 +22,53 @@ from conversimple import (
     UnauthorizedError,
     ForbiddenError,
 )
+from conversimple.api import _stream, models
+from conversimple.api._cache import TTLCache
 from conversimple.config import Config
+from fake_transport import route_to_handler
 
 # Use Config defaults for all test URLs
 BASE_URL = Config.API_ENDPOINT
 
+PATH_AGENTS = "/api/v1/agents"
+PATH_AGENT_1 = f"{PATH_AGENTS}/agent-1"
+PATH_DEPLOYMENTS = "/api/v1/deployments"
+PATH_API_KEY = "/api/v1/settings/api-key"
+
+URL_AGENTS = f"{BASE_URL}{PATH_AGENTS}"
+URL_API_KEY = f"{BASE_URL}{PATH_API_KEY}"
+URL_API_KEY_USAGE = f"{URL_API_KEY}/usage"
+
+AGENT_1 = {
+    "id": "agent-1",
+    "name": "Support Bot",
+    "description": "Support agent",
+    "status": "published",
+    "version": 1,
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+AGENT_1_V2 = {**AGENT_1, "version": 2, "updated_at": "2024-01-02T00:00:00Z"}
+
+DEPLOY_1 = {
+    "id": "deploy-1",
+    "name": "Support Widget",
+    "agent_id": "agent-1",
+    "channel": "widget",
+    "status": "active",
+    "environment": "widget",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+
+PAGE_META = {"page": 1, "per_page": 20, "total_count": 1}
+
 
 class TestPlatformClientInitialization:
     """Test PlatformClient initialization."""
 
-    def test_init_with_defaults(self):
+    def test_init_with_defaults(self, client):
         """Test initialization with default parameters."""
-        client = PlatformClient(api_key="test-key")
         assert client._http_client.api_key == "test-key"
         assert client._http_client.api_endpoint == Config.API_ENDPOINT
         assert client._http_client.timeout == 30
@@ -50,326 +89,731 @@ class TestPlatformClientInitialization:
         )
         assert client._http_client.api_endpoint == Config.API_ENDPOINT
 
-    def test_endpoints_are_accessible(self):
+    def test_init_with_connection_limits(self):
+        """Test that pool limits are configurable."""
+        client = PlatformClient(
+            api_key="test-key",
+            max_connections=10,
+            max_keepalive_connections=5,
+        )
+        assert client._http_client.limits.max_connections == 10
+        assert client._http_client.limits.max_keepalive_connections == 5
+
+    def test_endpoints_are_accessible(self, client):
         """Test that all endpoints are accessible."""
-        client = PlatformClient(api_key="test-key")
         assert hasattr(client, "agents")
         assert hasattr(client, "deployments")
         assert hasattr(client, "api_keys")
 
+    def test_context_manager_closes_connection_pool(self):
+        """Test that exiting the context manager closes the HTTP client."""
+        with PlatformClient(api_key="test-key") as client:
+            assert not client._http_client._client.is_closed
+        assert client._http_client._client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_async_client_context_manager(self):
+        """Test AsyncPlatformClient wiring and async context manager."""
+        async with AsyncPlatformClient(api_key="test-key") as client:
+            assert client._http_client.api_endpoint == Config.API_ENDPOINT
+            assert hasattr(client, "agents")
+            assert hasattr(client, "deployments")
+            assert hasattr(client, "api_keys")
+        assert client._http_client._client.is_closed
+
+
+class TestPackageImports:
+    """Test lazy package exports."""
+
+    def test_import_defers_http_stack(self):
+        """Test that importing the package does not load httpx until needed."""
+        code = (
+            "import sys, conversimple; conversimple.Config; "
+            "assert 'httpx' not in sys.modules; "
+            "conversimple.PlatformClient; "
+            "assert 'httpx' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestConfig:
+    """Test lazily read configuration."""
+
+    def test_env_read_on_access_and_update_casts(self, monkeypatch):
+        """Test that env changes apply after invalidate and update casts values."""
+        setting = Config.__dict__["API_TIMEOUT"]
+        monkeypatch.setattr(setting, "_override", setting._override)
+        monkeypatch.setattr(setting, "_cached", setting._cached)
+
+        monkeypatch.setenv("CONVERSIMPLE_API_TIMEOUT", "7")
+        Config.invalidate()
+        assert Config.API_TIMEOUT == 7
+
+        Config.update(API_TIMEOUT="20")
+        assert Config.API_TIMEOUT == 20
+        assert PlatformClient(api_key="test-key")._http_client.timeout == 20
+
 
 class TestHTTPClientHeaders:
     """Test HTTP client header management."""
 
-    def test_auth_header_format(self):
-        """Test that auth header is properly formatted."""
-        client = PlatformClient(api_key="my-secret-key")
+    def test_headers(self, client):
+        """Test auth, content type and user agent headers."""
         headers = client._http_client._get_headers()
-        assert headers["Authorization"] == "Bearer my-secret-key"
 
-    def test_content_type_header(self):
-        """Test content type header is set."""
-        client = PlatformClient(api_key="test-key")
-        headers = client._http_client._get_headers()
+        assert headers["Authorization"] == "Bearer test-key"
         assert headers["Content-Type"] == "application/json"
-
-    def test_user_agent_header(self):
-        """Test user agent header includes version."""
-        client = PlatformClient(api_key="test-key")
-        headers = client._http_client._get_headers()
         assert "conversimple-sdk" in headers["User-Agent"]
 
 
 class TestExceptionHandling:
     """Test exception handling for different HTTP status codes."""
 
-    @responses.activate
-    def test_422_validation_error(self):
-        """Test that 422 status raises ValidationError."""
-        responses.add(
-            responses.GET,
-            f"{BASE_URL}/api/v1/agents",
-            json={
-                "message": "Validation failed",
-                "errors": {"name": "Name is required"}
-            },
-            status=422,
+    @pytest.mark.parametrize("status,exc,payload", [
+        (
+            422,
+            ValidationError,
+            {"message": "Validation failed", "errors": {"name": "Name is required"}},
+        ),
+        (404, NotFoundError, {"message": "Agent not found"}),
+        (401, UnauthorizedError, {"message": "Invalid API key"}),
+        (403, ForbiddenError, {"message": "Forbidden"}),
+    ])
+    def test_error_status_raises(self, client, mocked_responses, status, exc, payload):
+        """Test that each error status raises its APIError subclass."""
+        mocked_responses.add(
+            "GET",
+            URL_AGENTS,
+            json=payload,
+            status=status,
         )
 
-        client = PlatformClient(api_key="test-key")
+        with pytest.raises(exc) as exc_info:
+            client._http_client.get(PATH_AGENTS)
+
+        assert exc_info.value.status_code == status
+        assert exc_info.value.message == payload["message"]
+        assert exc_info.value.response_data == payload
+        if exc is ValidationError:
+            assert exc_info.value.errors == payload["errors"]
+
+    @pytest.mark.parametrize("response", [
+        httpx.Response(502, html="<html><body>Bad Gateway</body></html>"),
+        httpx.Response(502, json=["not", "a", "dict"]),
+    ], ids=["html", "json-list"])
+    def test_non_dict_error_body_becomes_message(self, client, response):
+        """Test that HTML and non-object JSON error bodies map to a message."""
+        with pytest.raises(APIError) as exc_info:
+            client._http_client._handle_error(response)
+
+        assert exc_info.value.status_code == 502
+        assert exc_info.value.response_data == {"message": response.text}
+        assert exc_info.value.message == response.text
+
+    @pytest.mark.parametrize("headers", [
+        {"Content-Type": "application/problem+json; charset=utf-8"},
+        {},
+    ], ids=["problem-json", "no-content-type"])
+    def test_json_error_body_decoded_by_media_type(self, client, headers):
+        """Test that +json and untyped JSON error bodies are still decoded."""
+        payload = {"message": "Invalid agent", "errors": {"name": "required"}}
+        response = httpx.Response(
+            422, content=json.dumps(payload).encode(), headers=headers
+        )
 
         with pytest.raises(ValidationError) as exc_info:
-            client._http_client.get("/api/v1/agents")
-
-        assert exc_info.value.status_code == 422
-        assert exc_info.value.errors == {"name": "Name is required"}
-
-    @responses.activate
-    def test_404_not_found_error(self):
-        """Test that 404 status raises NotFoundError."""
-        responses.add(
-            responses.GET,
-            f"{BASE_URL}/api/v1/agents/123",
-            json={"message": "Agent not found"},
-            status=404,
+            client._http_client._handle_error(response)
+
+        assert exc_info.value.message == "Invalid agent"
+        assert exc_info.value.errors == {"name": "required"}
+
+    def test_exception_defaults(self):
+        """Test that exceptions fall back to their default message and status."""
+        error = ValidationError(response_data={"errors": {"name": "required"}})
+
+        assert str(NotFoundError()) == "[404] Resource not found"
+        assert str(APIError("Boom")) == "Boom"
+        assert error.status_code == 422
+        assert str(error) == "[422] Validation failed\n  name: required"
+
+    @pytest.mark.parametrize("error", [
+        APIError("Boom", 500, {"message": "Boom", "a": 1}),
+        ValidationError(response_data={"errors": {"name": "required"}}),
+    ], ids=["api-error", "validation-error"])
+    def test_exceptions_survive_pickling(self, error):
+        """Test that status, response data and field errors survive pickling."""
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is type(error)
+        assert restored.message == error.message
+        assert restored.status_code == error.status_code
+        assert restored.response_data == error.response_data
+        assert str(restored) == str(error)
+        if isinstance(error, ValidationError):
+            assert restored.errors == error.errors
+
+
+class TestResponseCache:
+    """Test in-process caching of idempotent GET responses."""
+
+    def test_ttl_cache_expiry_and_stale_window(self, monkeypatch):
+        """Test that entries expire and are then served only as stale."""
+        now = [100.0]
+        monkeypatch.setattr("conversimple.api._cache.time.monotonic", lambda: now[0])
+        cache = TTLCache()
+        cache.set("key", "value", ttl=10, stale_ttl=5)
+
+        assert cache.get("key") == (110.0, "value")
+        now[0] = 112.0
+        assert cache.get("key") == (110.0, "value")
+        now[0] = 116.0
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_ttl_cache_evicts_oldest_when_full(self):
+        """Test that the oldest entry is evicted at maxsize."""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.set("c", 3, ttl=60)
+
+        assert cache.get("a") is None
+        assert cache.get("c")[1] == 3
+
+    def test_cached_get_and_invalidation(self, monkeypatch):
+        """Test that cached reads skip HTTP until invalidated."""
+        client = PlatformClient(api_key="test-key", cache_enabled=True)
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"data": {"tools": []}})
+
+        route_to_handler(client._http_client, handler, monkeypatch)
+
+        assert client.agents.get_agent_spec("agent-1") == {"tools": []}
+        client.agents.get_agent_spec("agent-1")
+        assert len(calls) == 1
+
+        client.invalidate_cache()
+        client.agents.get_agent_spec("agent-1")
+        assert len(calls) == 2
+
+    def test_mutation_invalidates_cached_reads(self, monkeypatch):
+        """Test that publishing an agent drops its cached spec and lists."""
+        client = PlatformClient(api_key="test-key", cache_enabled=True)
+        calls = []
+
+        def handler(request):
+            if request.method == "POST":
+                return httpx.Response(200, json={"success": True, "data": AGENT_1_V2})
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"data": {"tools": []}})
+
+        route_to_handler(client._http_client, handler, monkeypatch)
+
+        client.agents.get_agent_spec("agent-1")
+        client.agents.get_agent_spec("agent-10")
+        client.agents.publish_agent("agent-1")
+        client.agents.get_agent_spec("agent-1")
+        client.agents.get_agent_spec("agent-10")
+
+        assert calls == [
+            f"{PATH_AGENT_1}/spec",
+            f"{PATH_AGENTS}/agent-10/spec",
+            f"{PATH_AGENT_1}/spec",
+        ]
+
+    def test_failed_mutation_still_invalidates(self, monkeypatch):
+        """Test that a delete rejected with 404 drops the cached agent."""
+        client = PlatformClient(api_key="test-key", cache_enabled=True)
+
+        def handler(request):
+            if request.method == "DELETE":
+                return httpx.Response(404, json={"message": "Agent not found"})
+            return httpx.Response(200, json={"success": True, "data": AGENT_1})
+
+        route_to_handler(client._http_client, handler, monkeypatch)
+
+        client.agents.get_agent("agent-1")
+        assert len(client._http_client._cache) == 1
+        with pytest.raises(NotFoundError):
+            client.agents.delete_agent("agent-1")
+
+        assert len(client._http_client._cache) == 0
+
+    def test_cache_disabled_by_default(self, client, monkeypatch):
+        """Test that GETs are not cached unless enabled."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"data": {}})
+
+        route_to_handler(client._http_client, handler, monkeypatch)
+
+        client.agents.get_agent_spec("agent-1")
+        client.agents.get_agent_spec("agent-1")
+        assert len(calls) == 2
+
+
+class TestRetries:
+    """Test retrying of transient failures."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record retry delays instead of sleeping."""
+        delays = []
+        monkeypatch.setattr("conversimple.api.client.time.sleep", delays.append)
+        return delays
+
+    def _queue_responses(self, client, monkeypatch, queued):
+        """Answer successive requests with the ``queued`` responses in order."""
+        route_to_handler(
+            client._http_client, lambda request: queued.pop(0), monkeypatch
         )
 
-        client = PlatformClient(api_key="test-key")
+    def test_get_retries_gateway_errors(self, client, monkeypatch, sleeps):
+        """Test that GET is retried on 503 with backoff."""
+        self._queue_responses(client, monkeypatch, [
+            httpx.Response(503),
+            httpx.Response(200, json={"data": {}}),
+        ])
+
+        assert client._http_client.get(PATH_AGENTS) == {"data": {}}
+        assert len(sleeps) == 1
+
+    def test_429_honors_retry_after(self, client, monkeypatch, sleeps):
+        """Test that 429 waits for Retry-After, even for POST."""
+        self._queue_responses(client, monkeypatch, [
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            httpx.Response(200, json={"data": {}}),
+        ])
+
+        client._http_client.post(PATH_AGENTS, json={})
+        assert sleeps == [7.0]
+
+    def test_post_not_retried_on_gateway_error(self, client, monkeypatch, sleeps):
+        """Test that non-idempotent requests fail fast on 5xx."""
+        self._queue_responses(client, monkeypatch, [httpx.Response(503)])
+
+        with pytest.raises(APIError) as exc_info:
+            client._http_client.post(PATH_AGENTS, json={})
+
+        assert exc_info.value.status_code == 503
+        assert sleeps == []
+
+    def test_gives_up_after_max_retries(self, monkeypatch, sleeps):
+        """Test that the last failure is raised once retries run out."""
+        client = PlatformClient(api_key="test-key", max_retries=2)
+        self._queue_responses(
+            client, monkeypatch, [httpx.Response(502) for _ in range(3)]
+        )
 
-        with pytest.raises(NotFoundError) as exc_info:
-            client._http_client.get("/api/v1/agents/123")
+        with pytest.raises(APIError):
+            client._http_client.get(PATH_AGENTS)
 
-        assert exc_info.value.status_code == 404
+        assert len(sleeps) == 2
 
-    @responses.activate
-    def test_401_unauthorized_error(self):
-        """Test that 401 status raises UnauthorizedError."""
-        responses.add(
-            responses.GET,
-            f"{BASE_URL}/api/v1/agents",
-            json={"message": "Invalid API key"},
-            status=401,
-        )
+    def test_zero_retries_sends_once(self, monkeypatch, sleeps):
+        """Test that max_retries=0 still sends the request once."""
+        client = PlatformClient(api_key="test-key", max_retries=0)
+        self._queue_responses(client, monkeypatch, [httpx.Response(502)])
 
-        client = PlatformClient(api_key="invalid-key")
+        with pytest.raises(APIError):
+            client._http_client.get(PATH_AGENTS)
 
-        with pytest.raises(UnauthorizedError):
-            client._http_client.get("/api/v1/agents")
+        assert sleeps == []
 
-    @responses.activate
-    def test_403_forbidden_error(self):
-        """Test that 403 status raises ForbiddenError."""
-        responses.add(
-            responses.GET,
-            f"{BASE_URL}/api/v1/agents",
-            json={"message": "Forbidden"},
-            status=403,
-        )
+    def test_negative_max_retries_rejected(self):
+        """Test that a negative retry count is rejected up front."""
+        with pytest.raises(ValueError, match="max_retries"):
+            PlatformClient(api_key="test-key", max_retries=-1)
 
-        client = PlatformClient(api_key="test-key")
 
-        with pytest.raises(ForbiddenError):
-            client._http_client.get("/api/v1/agents")
+class TestAsyncClient:
+    """Test AsyncPlatformClient requests over a mock transport."""
 
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record async retry delays instead of sleeping."""
+        delays = []
 
-class TestAgentEndpoint:
-    """Test Agent management endpoints."""
+        async def fake_sleep(delay):
+            delays.append(delay)
 
-    @responses.activate
-    def test_list_agents(self):
-        """Test listing agents."""
-        responses.add(
-            responses.GET,
-            f"{BASE_URL}/api/v1/agents",
-            json={
-                "success": True,
-                "data": [
-                    {
-                        "id": "agent-1",
-                        "name": "Support Bot",
-                        "description": "Support agent",
-                        "status": "published",
-                        "version": 1,
-                        "created_at": "2024-01-01T00:00:00Z",
-                        "updated_at": "2024-01-01T00:00:00Z",
-                    }
-                ],
-                "meta": {"page": 1, "per_page": 20, "total_count": 1}
-            },
-            status=200,
-        )
+        monkeypatch.setattr("conversimple.api.client.asyncio.sleep", fake_sleep)
+        return delays
 
-        client = PlatformClient(api_key="test-key")
-        agents, meta = client.agents.list_agents(page=1, per_page=20)
+    @staticmethod
+    def _agent_pages(total, page_size):
+        """Handler serving ``total`` agents in pages of ``page_size``."""
+        requested = []
 
-        assert len(agents) == 1
-        assert agents[0].name == "Support Bot"
-        assert meta["total_count"] == 1
+        def handler(request):
+            page = int(request.url.params["page"])
+            requested.append(page)
+            start = (page - 1) * page_size
+            data = [
+                {**AGENT_1, "id": f"agent-{i}"}
+                for i in range(start, min(start + page_size, total))
+            ]
+            meta = {"page": page, "per_page": page_size, "total_count": total}
+            return httpx.Response(
+                200, json={"success": True, "data": data, "meta": meta}
+            )
 
-    @responses.activate
-    def test_create_agent(self):
-        """Test creating an agent."""
-        responses.add(
-            responses.POST,
-            f"{BASE_URL}/api/v1/agents",
-            json={
-                "success": True,
-                "data": {
-                    "id": "agent-new",
-                    "name": "New Agent",
-                    "description": "A new agent",
-                    "status": "draft",
-                    "version": 1,
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "updated_at": "2024-01-01T00:00:00Z",
-                }
-            },
-            status=200,
-        )
+        return handler, requested
 
-        client = PlatformClient(api_key="test-key")
-        agent = client.agents.create_agent(
-            name="New Agent",
-            description="A new agent"
-        )
+    @pytest.mark.asyncio
+    async def test_get_agent(self, monkeypatch):
+        """Test that an async endpoint method sends its request and decodes it."""
+        seen = []
 
-        assert agent.id == "agent-new"
-        assert agent.name == "New Agent"
-        assert agent.status == "draft"
-
-    @responses.activate
-    def test_get_agent(self):
-        """Test getting a single agent."""
-        responses.add(
-            responses.GET,
-            f"{BASE_URL}/api/v1/agents/agent-1",
-            json={
-                "success": True,
-                "data": {
-                    "id": "agent-1",
-                    "name": "Support Bot",
-                    "description": "Support agent",
-                    "status": "published",
-                    "version": 1,
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "updated_at": "2024-01-01T00:00:00Z",
-                }
-            },
-            status=200,
-        )
+        def handler(request):
+            seen.append((request.method, request.url.path))
+            return httpx.Response(200, json={"success": True, "data": AGENT_1})
 
-        client = PlatformClient(api_key="test-key")
-        agent = client.agents.get_agent("agent-1")
+        async with AsyncPlatformClient(api_key="test-key") as client:
+            route_to_handler(client._http_client, handler, monkeypatch)
+            agent = await client.agents.get_agent("agent-1")
 
-        assert agent.id == "agent-1"
         assert agent.name == "Support Bot"
+        assert seen == [("GET", PATH_AGENT_1)]
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self, monkeypatch):
+        """Test that async requests map error statuses to exceptions."""
+        async with AsyncPlatformClient(api_key="test-key") as client:
+            route_to_handler(
+                client._http_client,
+                lambda request: httpx.Response(404, json={"message": "Not found"}),
+                monkeypatch,
+            )
+            with pytest.raises(NotFoundError) as exc_info:
+                await client.agents.get_agent("agent-1")
+
+        assert exc_info.value.message == "Not found"
+
+    @pytest.mark.asyncio
+    async def test_retries_gateway_errors(self, monkeypatch, sleeps):
+        """Test that async GETs are retried on 503 with backoff."""
+        queued = [httpx.Response(503), httpx.Response(200, json={"data": {}})]
+
+        async with AsyncPlatformClient(api_key="test-key") as client:
+            route_to_handler(
+                client._http_client, lambda request: queued.pop(0), monkeypatch
+            )
+            assert await client._http_client.get(PATH_AGENTS) == {"data": {}}
+
+        assert len(sleeps) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("prefetch", [True, False])
+    async def test_iter_agents(self, monkeypatch, prefetch):
+        """Test async paging with prefetching and with streamed pages."""
+        handler, requested = self._agent_pages(total=5, page_size=2)
+
+        async with AsyncPlatformClient(api_key="test-key") as client:
+            route_to_handler(client._http_client, handler, monkeypatch)
+            agents = [
+                agent
+                async for agent in client.agents.iter_agents(
+                    per_page=2, prefetch=prefetch
+                )
+            ]
+
+        assert [agent.id for agent in agents] == [f"agent-{i}" for i in range(5)]
+        assert requested == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("prefetch", [True, False])
+    async def test_iter_agents_follows_total_count_past_capped_pages(
+        self, monkeypatch, prefetch
+    ):
+        """Test that async paging isn't cut short by a capped page size."""
+        handler, requested = self._agent_pages(total=5, page_size=2)
+
+        async with AsyncPlatformClient(api_key="test-key") as client:
+            route_to_handler(client._http_client, handler, monkeypatch)
+            agents = [
+                agent
+                async for agent in client.agents.iter_agents(
+                    per_page=4, prefetch=prefetch
+                )
+            ]
+
+        assert [agent.id for agent in agents] == [f"agent-{i}" for i in range(5)]
+        assert requested == [1, 2, 3]
+
+
+class TestStreaming:
+    """Test streamed responses and auto-pagination."""
+
+    BODY = b'{"data": {"tools": [{"name": "a"}, {"name": "b"}]}, "meta": {}}'
+
+    @pytest.mark.parametrize("use_ijson", [True, False])
+    def test_parser_extracts_items_across_chunks(self, monkeypatch, use_ijson):
+        """Test that items split across chunks are parsed with or without ijson."""
+        if use_ijson:
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr(_stream, "ijson", None)
+
+        parser = _stream.JSONItemParser("data.tools.item")
+        items = []
+        for i in range(0, len(self.BODY), 7):
+            items.extend(parser.feed(self.BODY[i:i + 7]))
+        items.extend(parser.close())
+
+        assert items == [{"name": "a"}, {"name": "b"}]
+
+    def test_streamed_iter_agents_without_total_count_stops_at_short_page(
+        self, client, monkeypatch
+    ):
+        """Test that without total_count streamed paging ends at a short page."""
+        pages = {1: [AGENT_1, AGENT_1], 2: [AGENT_1]}
+        requested = []
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            requested.append(page)
+            return httpx.Response(
+                200, json={"success": True, "data": pages[page], "meta": {}}
+            )
+
+        route_to_handler(client._http_client, handler, monkeypatch)
+
+        agents = list(client.agents.iter_agents(per_page=2, prefetch=False))
+
+        assert len(agents) == 3
+        assert requested == [1, 2]
+
+    def test_prefetched_iter_deployments_stops_at_total_count(
+        self, client, monkeypatch
+    ):
+        """Test that prefetching stops once total_count items were listed."""
+        requested = []
+
+        def fake_list_deployments(page, per_page, *filters):
+            requested.append(page)
+            return [f"deploy-{page}-{i}" for i in range(per_page)], {
+                "page": page,
+                "per_page": per_page,
+                "total_count": 4,
+            }
+
+        monkeypatch.setattr(
+            client.deployments, "list_deployments", fake_list_deployments
+        )
 
-    @responses.activate
-    def test_update_agent(self):
-        """Test updating an agent."""
-        responses.add(
-            responses.PUT,
-            f"{BASE_URL}/api/v1/agents/agent-1",
-            json={
-                "success": True,
-                "data": {
-                    "id": "agent-1",
-                    "name": "Updated Bot",
-                    "description": "Support agent",
-                    "status": "draft",
-                    "version": 2,
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "updated_at": "2024-01-02T00:00:00Z",
-                }
-            },
-            status=200,
+        deployments = list(client.deployments.iter_deployments(per_page=2))
+
+        assert deployments == [
+            "deploy-1-0", "deploy-1-1", "deploy-2-0", "deploy-2-1"
+        ]
+        assert requested == [1, 2]
+
+    @pytest.mark.parametrize("prefetch,use_ijson", [
+        (True, True),
+        (False, True),
+        (False, False),
+    ], ids=["prefetched", "streamed-ijson", "streamed-orjson"])
+    def test_iter_agents_follows_total_count_past_capped_pages(
+        self, client, monkeypatch, prefetch, use_ijson
+    ):
+        """Test that a server capping page size doesn't end iteration early."""
+        if use_ijson:
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr(_stream, "ijson", None)
+        requested = []
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            requested.append(page)
+            start = (page - 1) * 50
+            data = [
+                {**AGENT_1, "id": f"agent-{i}"}
+                for i in range(start, min(start + 50, 120))
+            ]
+            meta = {"page": page, "per_page": 50, "total_count": 120}
+            return httpx.Response(
+                200, json={"success": True, "data": data, "meta": meta}
+            )
+
+        route_to_handler(client._http_client, handler, monkeypatch)
+
+        agents = list(client.agents.iter_agents(prefetch=prefetch))
+
+        assert [agent.id for agent in agents] == [f"agent-{i}" for i in range(120)]
+        assert requested == [1, 2, 3]
+
+
+class TestModels:
+    """Test API model validation."""
+
+    @pytest.mark.parametrize("use_ciso8601", [True, False])
+    def test_timestamps_parsed_with_or_without_ciso8601(
+        self, monkeypatch, use_ciso8601
+    ):
+        """Test that ISO-8601 timestamps parse with or without ciso8601."""
+        if use_ciso8601:
+            pytest.importorskip("ciso8601")
+        else:
+            monkeypatch.setattr(models, "ciso8601", None)
+
+        usage = ApiKeyUsage.model_validate({
+            "requests_24h": 1,
+            "requests_month": 2,
+            "rate_limit": 100,
+            "rate_limit_remaining": 99,
+            "last_request_at": "2024-01-15T10:30:00Z",
+        })
+
+        assert usage.last_request_at == datetime.fromisoformat(
+            "2024-01-15T10:30:00+00:00"
         )
 
-        client = PlatformClient(api_key="test-key")
-        agent = client.agents.update_agent("agent-1", name="Updated Bot")
+    def test_timestamps_ciso8601_rejects_fall_back_to_pydantic(self, monkeypatch):
+        """Test that strings ciso8601 can't parse are left to pydantic."""
 
-        assert agent.name == "Updated Bot"
-        assert agent.version == 2
+        def parse_datetime(value):
+            raise ValueError(f"Invalid ISO 8601 string: {value!r}")
 
-    @responses.activate
-    def test_delete_agent(self):
-        """Test deleting an agent."""
-        responses.add(
-            responses.DELETE,
-            f"{BASE_URL}/api/v1/agents/agent-1",
-            json={"success": True},
-            status=200,
+        monkeypatch.setattr(
+            models, "ciso8601", SimpleNamespace(parse_datetime=parse_datetime)
         )
 
-        client = PlatformClient(api_key="test-key")
-        client.agents.delete_agent("agent-1")
+        usage = ApiKeyUsage.model_validate({
+            "requests_24h": 1,
+            "requests_month": 2,
+            "rate_limit": 100,
+            "rate_limit_remaining": 99,
+            "last_request_at": "1704067200",
+        })
+
+        assert usage.last_request_at == datetime.fromisoformat(
+            "2024-01-01T00:00:00+00:00"
+        )
+
+    def test_models_are_frozen_and_accept_field_names(self):
+        """Test that models reject mutation and populate aliased fields by name."""
+        info = ApiKeyInfo.model_validate({
+            "status": "active",
+            "last_4_chars": "abcd",
+            "created_at": "2024-01-15T10:30:00Z",
+            "unknown_field": True,
+        })
+
+        assert info.last_4_chars == "abcd"
+        assert not hasattr(info, "unknown_field")
+        with pytest.raises(PydanticValidationError):
+            info.status = "rotated"
 
-        assert len(responses.calls) == 1
 
-    @responses.activate
-    def test_publish_agent(self):
-        """Test publishing an agent."""
-        responses.add(
-            responses.POST,
-            f"{BASE_URL}/api/v1/agents/agent-1/publish",
-            json={
+class TestAgentEndpoint:
+    """Test Agent management endpoints."""
+
+    @pytest.mark.parametrize("resp_json,client_call,expected_call,check", [
+        pytest.param(
+            {"success": True, "data": [AGENT_1], "meta": PAGE_META},
+            lambda c: c.agents.list_agents(page=1, per_page=20),
+            ("GET", PATH_AGENTS),
+            lambda r: (
+                len(r[0]) == 1
+                and r[0][0].name == "Support Bot"
+                and r[1]["total_count"] == 1
+            ),
+            id="list",
+        ),
+        pytest.param(
+            {
                 "success": True,
                 "data": {
-                    "id": "agent-1",
-                    "name": "Support Bot",
-                    "description": "Support agent",
-                    "status": "published",
-                    "version": 2,
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "updated_at": "2024-01-02T00:00:00Z",
-                }
+                    **AGENT_1,
+                    "id": "agent-new",
+                    "name": "New Agent",
+                    "description": "A new agent",
+                    "status": "draft",
+                },
             },
-            status=200,
-        )
+            lambda c: c.agents.create_agent(
+                name="New Agent", description="A new agent"
+            ),
+            ("POST", PATH_AGENTS),
+            lambda r: (r.id, r.name, r.status) == ("agent-new", "New Agent", "draft"),
+            id="create",
+        ),
+        pytest.param(
+            {"success": True, "data": AGENT_1},
+            lambda c: c.agents.get_agent("agent-1"),
+            ("GET", PATH_AGENT_1),
+            lambda r: (r.id, r.name) == ("agent-1", "Support Bot"),
+            id="get",
+        ),
+        pytest.param(
+            {
+                "success": True,
+                "data": {**AGENT_1_V2, "name": "Updated Bot", "status": "draft"},
+            },
+            lambda c: c.agents.update_agent("agent-1", name="Updated Bot"),
+            ("PUT", PATH_AGENT_1),
+            lambda r: (r.name, r.version) == ("Updated Bot", 2),
+            id="update",
+        ),
+        pytest.param(
+            {"success": True, "data": AGENT_1_V2},
+            lambda c: c.agents.publish_agent("agent-1"),
+            ("POST", f"{PATH_AGENT_1}/publish"),
+            lambda r: r.status == "published",
+            id="publish",
+        ),
+    ])
+    def test_agent_calls(
+        self, client, fake_http, resp_json, client_call, expected_call, check
+    ):
+        """Test that each agent method makes its request and decodes the reply."""
+        fake_http.next_return = resp_json
+
+        result = client_call(client)
+
+        assert fake_http.calls[0][:2] == expected_call
+        assert check(result)
+
+    def test_delete_agent(self, client, fake_http):
+        """Test deleting an agent."""
+        fake_http.next_return = {"success": True}
 
-        client = PlatformClient(api_key="test-key")
-        agent = client.agents.publish_agent("agent-1")
+        client.agents.delete_agent("agent-1")
 
-        assert agent.status == "published"
+        assert fake_http.count == 1
+        assert fake_http.calls[0][:2] == ("DELETE", PATH_AGENT_1)
 
 
 class TestDeploymentEndpoint:
     """Test Deployment management endpoints."""
 
-    @responses.activate
-    def test_list_deployments(self):
+    def test_list_deployments(self, client, fake_http):
         """Test listing deployments."""
-        responses.add(
-            responses.GET,
-            f"{BASE_URL}/api/v1/deployments",
-            json={
-                "success": True,
-                "data": [
-                    {
-                        "id": "deploy-1",
-                        "name": "Support Widget",
-                        "agent_id": "agent-1",
-                        "channel": "widget",
-                        "status": "active",
-                        "environment": "widget",
-                        "created_at": "2024-01-01T00:00:00Z",
-                        "updated_at": "2024-01-01T00:00:00Z",
-                    }
-                ],
-                "meta": {"page": 1, "per_page": 20, "total_count": 1}
-            },
-            status=200,
-        )
+        fake_http.next_return = {
+            "success": True,
+            "data": [DEPLOY_1],
+            "meta": PAGE_META,
+        }
 
-        client = PlatformClient(api_key="test-key")
         deployments, meta = client.deployments.list_deployments()
 
         assert len(deployments) == 1
         assert deployments[0].name == "Support Widget"
 
-    @responses.activate
-    def test_create_deployment(self):
+    def test_create_deployment(self, client, fake_http):
         """Test creating a deployment."""
-        responses.add(
-            responses.POST,
-            f"{BASE_URL}/api/v1/deployments",
-            json={
-                "success": True,
-                "data": {
-                    "id": "deploy-new",
-                    "name": "Support Widget",
-                    "agent_id": "agent-1",
-                    "channel": "widget",
-                    "status": "pending",
-                    "environment": "widget",
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "updated_at": "2024-01-01T00:00:00Z",
-                }
-            },
-            status=200,
-        )
+        fake_http.next_return = {
+            "success": True,
+            "data": {**DEPLOY_1, "id": "deploy-new", "status": "pending"},
+        }
 
-        client = PlatformClient(api_key="test-key")
         deployment = client.deployments.create_deployment(
             name="Support Widget",
             agent_id="agent-1",
@@ -378,82 +822,75 @@ class TestDeploymentEndpoint:
 
         assert deployment.id == "deploy-new"
         assert deployment.channel == "widget"
+        assert fake_http.calls[0][2]["json"]["agent_id"] == "agent-1"
 
-    @responses.activate
-    def test_activate_deployment(self):
+    def test_activate_deployment(self, client, fake_http):
         """Test activating a deployment."""
-        responses.add(
-            responses.POST,
-            f"{BASE_URL}/api/v1/deployments/deploy-1/activate",
-            json={
-                "success": True,
-                "data": {
-                    "id": "deploy-1",
-                    "name": "Support Widget",
-                    "agent_id": "agent-1",
-                    "channel": "widget",
-                    "status": "active",
-                    "environment": "widget",
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "updated_at": "2024-01-02T00:00:00Z",
-                }
-            },
-            status=200,
-        )
+        fake_http.next_return = {
+            "success": True,
+            "data": {**DEPLOY_1, "updated_at": "2024-01-02T00:00:00Z"},
+        }
 
-        client = PlatformClient(api_key="test-key")
         deployment = client.deployments.activate_deployment("deploy-1")
 
         assert deployment.status == "active"
+        assert fake_http.calls[0][:2] == (
+            "POST", f"{PATH_DEPLOYMENTS}/deploy-1/activate"
+        )
+
+
+@pytest.fixture(scope="class")
+def api_key_responses(class_responses):
+    """Register every API key endpoint response once per test class."""
+    class_responses.add(
+        "GET",
+        URL_API_KEY,
+        json={
+            "success": True,
+            "data": {
+                "status": "active",
+                "last_4": "1234",
+                "created_at": "2024-01-01T00:00:00Z",
+                "last_used_at": "2024-01-02T00:00:00Z",
+            }
+        },
+        status=200,
+    )
+    class_responses.add(
+        "GET",
+        URL_API_KEY_USAGE,
+        json={
+            "success": True,
+            "data": {
+                "requests_24h": 100,
+                "requests_month": 5000,
+                "rate_limit": 10000,
+                "rate_limit_remaining": 5000,
+                "last_request_at": "2024-01-02T12:00:00Z",
+            }
+        },
+        status=200,
+    )
+    return class_responses
 
 
 class TestApiKeyEndpoint:
     """Test API Key management endpoints."""
 
-    @responses.activate
-    def test_get_api_key_info(self):
-        """Test getting API key info."""
-        responses.add(
-            responses.GET,
-            f"{BASE_URL}/api/v1/settings/api-key",
-            json={
-                "success": True,
-                "data": {
-                    "status": "active",
-                    "last_4": "1234",
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "last_used_at": "2024-01-02T00:00:00Z",
-                }
-            },
-            status=200,
-        )
+    @pytest.fixture
+    def mocked_responses(self, api_key_responses):
+        """Serve the class-wide API key responses to every test."""
+        return api_key_responses
 
-        client = PlatformClient(api_key="test-key")
+    def test_get_api_key_info(self, client):
+        """Test getting API key info."""
         key_info = client.api_keys.get_api_key_info()
 
         assert key_info.status == "active"
         assert key_info.last_4_chars == "1234"
 
-    @responses.activate
-    def test_get_api_key_usage(self):
+    def test_get_api_key_usage(self, client):
         """Test getting API key usage statistics."""
-        responses.add(
-            responses.GET,
-            f"{BASE_URL}/api/v1/settings/api-key/usage",
-            json={
-                "success": True,
-                "data": {
-                    "requests_24h": 100,
-                    "requests_month": 5000,
-                    "rate_limit": 10000,
-                    "rate_limit_remaining": 5000,
-                    "last_request_at": "2024-01-02T12:00:00Z",
-                }
-            },
-            status=200,
-        )
-
-        client = PlatformClient(api_key="test-key")
         usage = client.api_keys.get_api_key_usage()
 
         assert usage.requests_24h == 100